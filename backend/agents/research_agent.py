@@ -1,4 +1,8 @@
-from typing import List, Dict, Set
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Optional, Set, Tuple
+import logging
+import os
 import re
 
 from environments.web.environment import WebEnvironment
@@ -8,24 +12,77 @@ from synthesis.answer_synthesizer import AnswerSynthesizer
 from confidence.confidence_scorer import ConfidenceScorer
 
 
+logger = logging.getLogger(__name__)
 
-def normalize(text: str) -> Set[str]:
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9\s]", "", text)
-
-    stopwords = {
-        "the", "is", "a", "an", "of", "to", "and", "in",
-        "for", "on", "with", "by", "as", "that", "this",
-        "what", "how", "why", "when", "where", "which",
-        "does", "do", "are", "was", "were", "will", "would",
-        "can", "could", "should", "must", "may", "might"
-    }
-
-    return {
+# Per-claim / per-document tracing is opt-in; it is far too chatty for normal runs.
+if os.getenv("RESEARCH_AGENT_VERBOSE", "").lower() in {"1", "true", "yes"}:
+    logger.setLevel(logging.DEBUG)
+
+_PUNCT_RE = re.compile(r"[^a-z0-9\s]")
+# Runs of 3+ alphanumerics; allows shorter words like "api", "aws"
+_TOKEN_RE = re.compile(r"[a-z0-9]{3,}")
+
+_STOPWORDS = frozenset({
+    "the", "is", "a", "an", "of", "to", "and", "in",
+    "for", "on", "with", "by", "as", "that", "this",
+    "what", "how", "why", "when", "where", "which",
+    "does", "do", "are", "was", "were", "will", "would",
+    "can", "could", "should", "must", "may", "might"
+})
+
+
+@lru_cache(maxsize=4096)
+def _tokens(text: str) -> Tuple[str, ...]:
+    """Significant words of `text`, memoized.
+
+    Planner retries re-fetch overlapping pages, so the same claim strings are
+    tokenized again and again; the cache turns repeats into a dict hit.
+    """
+    # Punctuation is dropped first so "covid-19" still becomes "covid19"
+    text = _PUNCT_RE.sub("", text.lower())
+
+    return tuple(
         word
-        for word in text.split()
-        if word not in stopwords and len(word) > 2  # Allow shorter words like "api", "aws"
-    }
+        for word in _TOKEN_RE.findall(text)
+        if word not in _STOPWORDS
+    )
+
+
+def normalize(text: str) -> Set[str]:
+    return set(_tokens(text))
+
+
+def signature(words: Set[str]) -> int:
+    """Fold a word set into a 64-bit bloom-style signature (one bit per word hash)."""
+    sig = 0
+    for word in words:
+        sig |= 1 << (hash(word) & 63)
+    return sig
+
+
+def is_relevant_with(question_words: Set[str], claim: str, question_sig: Optional[int] = None) -> bool:
+    """Relevance check against an already-normalized question.
+
+    Lets callers normalize the question once instead of once per claim.
+    Claim words are screened against the question signature first, so only
+    words whose bit is set pay for the exact set lookup, and the scan stops
+    at the first real overlap without building the claim's word set.
+    """
+    if question_sig is None:
+        question_sig = signature(question_words)
+
+    # At least 1 keyword match is enough
+    for word in _tokens(claim):
+        if (question_sig >> (hash(word) & 63)) & 1 and word in question_words:
+            return True
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "[Relevance] SKIP claim (no overlap): claim_words=%s... question_words=%s",
+            list(normalize(claim))[:5], list(question_words),
+        )
+
+    return False
 
 
 def is_relevant(claim: str, question: str) -> bool:
@@ -33,17 +90,22 @@ def is_relevant(claim: str, question: str) -> bool:
     
     More permissive matching - requires at least 1 significant keyword overlap.
     """
-    claim_words = normalize(claim)
-    question_words = normalize(question)
-    overlap = claim_words & question_words
-    
-    # At least 1 keyword match is enough 
-    is_match = len(overlap) >= 1
-    
-    if not is_match:
-        print(f"[Relevance] SKIP claim (no overlap): claim_words={list(claim_words)[:5]}... question_words={list(question_words)}")
-    
-    return is_match
+    return is_relevant_with(normalize(question), claim)
+
+
+def dedupe_claims(claims: List[ExtractedClaim]) -> List[ExtractedClaim]:
+    """Drop repeated claims from the same source, keeping first-seen order.
+
+    Keyed on (case/whitespace-normalized text, source_url): the same claim from
+    two different sources is kept, because that is what the verifier counts as
+    multi-source agreement.
+    """
+    seen: Dict[Tuple[str, str], ExtractedClaim] = {}
+    for claim in claims:
+        key = (" ".join(claim.claim.lower().split()), claim.source_url)
+        if key not in seen:
+            seen[key] = claim
+    return list(seen.values())
 
 
 class ResearchAgent:
@@ -51,6 +113,8 @@ class ResearchAgent:
     Orchestrates environment → extraction → verification → confidence → meta-control → synthesis
     """
 
+    MAX_EXTRACT_WORKERS = 8
+
     def __init__(
         self,
         web_environment: WebEnvironment,
@@ -65,34 +129,49 @@ class ResearchAgent:
         self.confidence_scorer = confidence_scorer
         self.synthesizer = answer_synthesizer
 
+    def _extract_from_document(self, doc) -> List[ExtractedClaim]:
+        logger.debug("[ResearchAgent] Extracting claims from: %s", doc.url)
+        return self.claim_extractor.extract_claims(
+            text=doc.text,
+            source_url=doc.url
+        )
+
     def research(self, question: str,num_docs:int=5) -> Dict:
         """
         Single-attempt research pipeline (Planner Agent will add retries later)
         """
 
-        print(f"[ResearchAgent] Starting research for: {question}")
+        logger.info("[ResearchAgent] Starting research for: %s", question)
 
         #  Observe the world
         documents = self.web_env.run(question,num_docs=num_docs)
-        print(f"[ResearchAgent] Retrieved {len(documents)} documents")
+        logger.info("[ResearchAgent] Retrieved %d documents", len(documents))
 
         #  Extract + filter claims
         extracted_claims: List[ExtractedClaim] = []
 
-        for doc in documents:
-            print(f"[ResearchAgent] Extracting claims from: {doc.url}")
-            claims = self.claim_extractor.extract_claims(
-                text=doc.text,
-                source_url=doc.url
-            )
-            print(f"[ResearchAgent] Found {len(claims)} raw claims from {doc.url}")
+        # Extraction is independent per document (one LLM call each), so fan it out.
+        # executor.map keeps document order so downstream grouping stays deterministic.
+        per_doc_claims: List[List[ExtractedClaim]] = []
+        if documents:
+            with ThreadPoolExecutor(max_workers=min(len(documents), self.MAX_EXTRACT_WORKERS)) as executor:
+                per_doc_claims = list(executor.map(self._extract_from_document, documents))
+
+        question_words = normalize(question)
+        question_sig = signature(question_words)
+
+        for doc, claims in zip(documents, per_doc_claims):
+            before = len(extracted_claims)
             for claim in claims:
-                if is_relevant(claim.claim, question):
+                if is_relevant_with(question_words, claim.claim, question_sig):
                     extracted_claims.append(claim)
-            print(f"[ResearchAgent] {len(extracted_claims)} total relevant claims so far")
+            logger.info(
+                "[ResearchAgent] %s: extracted %d claims, %d relevant",
+                doc.url, len(claims), len(extracted_claims) - before,
+            )
 
         if not extracted_claims:
-            print(f"[ResearchAgent] No relevant claims extracted, returning low confidence")
+            logger.info("[ResearchAgent] No relevant claims extracted, returning low confidence")
             return {
                 "answer": "Insufficient verified information is available to answer this question.",
                 "confidence_level": "LOW",
@@ -101,15 +180,20 @@ class ResearchAgent:
                 "notes": "Further investigation is recommended."
             }
 
-        print(f"[ResearchAgent] Total extracted claims: {len(extracted_claims)}")
+        total = len(extracted_claims)
+        extracted_claims = dedupe_claims(extracted_claims)
+        logger.info(
+            "[ResearchAgent] %d relevant claims, %d after de-duplication",
+            total, len(extracted_claims),
+        )
 
         #  Verify claims
         verified_claims = self.verifier.verify(extracted_claims)
-        print(f"[ResearchAgent] Verified {len(verified_claims)} claims")
+        logger.info("[ResearchAgent] Verified %d claims", len(verified_claims))
 
         #  Score confidence
         confidence = self.confidence_scorer.score(verified_claims)
-        print(f"[ResearchAgent] Confidence: {confidence}")
+        logger.info("[ResearchAgent] Confidence: %s", confidence)
 
        #  Synthesize answer (NO decisions)
         return self.synthesizer.synthesize(
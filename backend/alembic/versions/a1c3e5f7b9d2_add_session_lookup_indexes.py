@@ -0,0 +1,61 @@
+"""add session lookup indexes
+
+Revision ID: a1c3e5f7b9d2
+Revises: 
+Create Date: 2026-10-16 00:00:00.000000
+
+First revision, but not a baseline: the tables themselves are created by
+storage.db.init_db(). See alembic/README for bootstrapping a database.
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c3e5f7b9d2'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, column expression) -- mirrors the Index() declarations on the models
+INDEXES = [
+    ("ix_answer_snap_session_created", "answer_snapshots", "session_id, created_at DESC"),
+    ("ix_planner_trace_session_attempt", "planner_traces", "session_id, attempt_number"),
+    ("ix_search_log_session_attempt", "search_logs", "session_id, attempt_number"),
+    ("ix_evidence_session", "evidence", "session_id"),
+]
+
+
+def _concurrently() -> str:
+    # Postgres builds without locking out writes on live tables; other
+    # dialects (SQLite for local runs) have no such option.
+    return "CONCURRENTLY " if op.get_context().dialect.name == "postgresql" else ""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not context.is_offline_mode():
+        inspector = sa.inspect(op.get_bind())
+        missing = [table for _name, table, _columns in INDEXES if not inspector.has_table(table)]
+        if missing:
+            raise RuntimeError(
+                f"Tables {missing} do not exist. On a fresh database run init_db() "
+                "and then `alembic stamp head` instead of upgrading."
+            )
+    concurrently = _concurrently()
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.execute(sa.text(f"CREATE INDEX {concurrently}IF NOT EXISTS {name} ON {table} ({columns})"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    concurrently = _concurrently()
+    with op.get_context().autocommit_block():
+        for name, _table, _columns in INDEXES:
+            op.execute(sa.text(f"DROP INDEX {concurrently}IF EXISTS {name}"))
@@ -0,0 +1,45 @@
+"""store query cache hash as bytea
+
+Revision ID: c3e5a7b9d1f3
+Revises: a1c3e5f7b9d2
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e5a7b9d1f3'
+down_revision: Union[str, Sequence[str], None] = 'a1c3e5f7b9d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows are keyed by hex SHA-256 digests, which never match the
+    # new 16-byte blake2b keys; the cache is derived data, so drop it.
+    op.execute(sa.text("DELETE FROM query_cache"))
+    # SQLite columns take any value (BLOB affinity comes from the model), so
+    # the emptied table needs no type change there.
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.execute(sa.text(
+        "ALTER TABLE query_cache ALTER COLUMN query_hash TYPE bytea "
+        "USING decode(query_hash, 'hex')"
+    ))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Likewise, blake2b keys would never match the old SHA-256 lookups.
+    op.execute(sa.text("DELETE FROM query_cache"))
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.execute(sa.text(
+        "ALTER TABLE query_cache ALTER COLUMN query_hash TYPE text "
+        "USING encode(query_hash, 'hex')"
+    ))
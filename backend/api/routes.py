@@ -1,22 +1,26 @@
 from __future__ import annotations
 
+import logging
 import os
+import re
 import sys
-import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Generator, Optional
+from typing import TYPE_CHECKING, Generator, Optional, Tuple
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
 
+_UUID_RE = re.compile(
+    r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z"
+)
+
+
 def _validate_uuid(session_id: str) -> bool:
-    """Validate that session_id is a valid UUID."""
-    try:
-        uuid.UUID(session_id)
-        return True
-    except (ValueError, AttributeError):
-        return False
+    """Validate that session_id is a canonical (hyphenated) UUID."""
+    return isinstance(session_id, str) and _UUID_RE.match(session_id) is not None
 from sqlalchemy.orm import Session
 
 # Allow existing modules to import using the historical layout (e.g. `verification.*`, `planner.*`)
@@ -31,27 +35,26 @@ from backend.api.schemas import (
     QuerySubmitResponse,
     QueryTraceResponse,
 )
-from backend.agents.VerificationAgent import VerificationAgent
-from backend.agents.research_agent import ResearchAgent
-from backend.confidence.confidence_scorer import ConfidenceScorer
-from backend.environments.web.environment import WebEnvironment
-from backend.environments.web.search import WebSearch
-from backend.planner.planner_agent import PlannerAgent
 from backend.storage.db import SessionLocal
 from backend.storage.repositories.answer_repo import AnswerSnapshotRepository
 from backend.storage.repositories.evidence_repo import EvidenceRepository
-from backend.storage.repositories.planner_trace_repo import PlannerTraceRepository
 from backend.storage.repositories.query_session_repo import QuerySessionRepository
-from backend.storage.repositories.search_log_repo import SearchLogRepository
-from backend.verification.claim_extractor import ClaimExtractor
-from backend.verification.verifier import VerificationEngine
-from backend.synthesis.answer_synthesizer import AnswerSynthesizer
 
+if TYPE_CHECKING:
+    from backend.environments.web.search import WebSearch
+    from backend.planner.planner_agent import PlannerAgent
+
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api")
 
 
 def get_db() -> Generator[Session, None, None]:
+    # Sync session on purpose: the endpoints are plain `def`, so FastAPI runs
+    # them in its threadpool and each holds a pooled connection only for its
+    # few short queries. The planner shares these repositories from worker
+    # threads, so an AsyncSession stack would duplicate every repository.
     db = SessionLocal()
     try:
         yield db
@@ -59,25 +62,92 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
-def _build_planner(db: Session) -> PlannerAgent:
+def _build_web_search() -> WebSearch:
+    from backend.environments.web.search import WebSearch
+
     # Web search configuration
     api_key = os.getenv("GOOGLE_SEARCH_API_KEY", "")
     endpoint = os.getenv("GOOGLE_SEARCH_ENDPOINT", "https://www.googleapis.com/customsearch/v1")
     cx = os.getenv("GOOGLE_SEARCH_CX", "")
+    return WebSearch(api_key=api_key, endpoint=endpoint, cx=cx)
+
+
+@lru_cache(maxsize=1)
+def _shared_components() -> Tuple:
+    """Stateless pipeline components, built once and shared by every background run.
+
+    Imported and constructed on first use so that workers serving only the
+    status/result endpoints never load the LLM/embedding stack. Per-request
+    state lives in WebEnvironment / PlannerAgent, which stay per-call.
+    """
+    from backend.agents.VerificationAgent import VerificationAgent
+    from backend.confidence.confidence_scorer import ConfidenceScorer
+    from backend.synthesis.answer_synthesizer import AnswerSynthesizer
+    from backend.verification.claim_extractor import ClaimExtractor
+    from backend.verification.verifier import VerificationEngine
+
+    return (
+        _build_web_search(),
+        ClaimExtractor(),
+        VerificationEngine(),
+        ConfidenceScorer(),
+        AnswerSynthesizer(),
+        VerificationAgent(),
+    )
+
+# Planner runs get their own pool instead of FastAPI's BackgroundTasks, which
+# share the request-handling threadpool and can starve status/result polls.
+# Threads (not processes) since a run is dominated by network and LLM I/O.
+#
+# Each run holds one pooled DB connection for its whole lifetime, so the
+# default of 8 stays under DB_POOL_SIZE (10) and leaves base connections for
+# the request handlers. Submissions beyond that wait in the executor's
+# (unbounded) queue and report their initial status until a worker frees up;
+# raise PLANNER_MAX_WORKERS together with DB_POOL_SIZE for more throughput.
+_PLANNER_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("PLANNER_MAX_WORKERS", "8")),
+    thread_name_prefix="planner",
+)
 
-    web_search = WebSearch(api_key=api_key, endpoint=endpoint, cx=cx)
-    web_env = WebEnvironment(search_client=web_search)
+
+@router.on_event("shutdown")
+def _shutdown_planner_executor() -> None:
+    # Let in-flight runs write their final status; queued ones never started.
+    _PLANNER_EXECUTOR.shutdown(wait=True, cancel_futures=True)
+
+
+def _log_planner_crash(session_id: str, future: Future) -> None:
+    # _run_planner_background handles planner errors itself; this only sees
+    # what escapes it (e.g. the DB session failing to open or close).
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Planner run for session %s crashed", session_id, exc_info=exc)
+
+
+def _build_planner(db: Session) -> PlannerAgent:
+    from backend.agents.research_agent import ResearchAgent
+    from backend.environments.web.environment import WebEnvironment
+    from backend.planner.planner_agent import PlannerAgent
+
+    (
+        web_search,
+        claim_extractor,
+        verifier,
+        conf_scorer,
+        synthesizer,
+        verification_agent,
+    ) = _shared_components()
 
     research_agent = ResearchAgent(
-        web_environment=web_env,
-        claim_extractor=ClaimExtractor(),
-        verification_engine=VerificationEngine(),
-        confidence_scorer=ConfidenceScorer(),
-        answer_synthesizer=AnswerSynthesizer(),
+        web_environment=WebEnvironment(search_client=web_search),
+        claim_extractor=claim_extractor,
+        verification_engine=verifier,
+        confidence_scorer=conf_scorer,
+        answer_synthesizer=synthesizer,
     )
 
-    verification_agent = VerificationAgent()
-
     return PlannerAgent(
         research_agent=research_agent,
         verification_agent=verification_agent,
@@ -110,7 +180,6 @@ def _run_planner_background(session_id: str, question: str) -> None:
 @router.post("/query", response_model=QuerySubmitResponse)
 def submit_query(
     payload: QuerySubmitRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ) -> QuerySubmitResponse:
     try:
@@ -126,7 +195,9 @@ def submit_query(
             detail="Database temporarily unavailable. Please retry later."
         )
 
-    background_tasks.add_task(_run_planner_background, str(session.id), payload.question)
+    session_id = str(session.id)
+    future = _PLANNER_EXECUTOR.submit(_run_planner_background, session_id, payload.question)
+    future.add_done_callback(partial(_log_planner_crash, session_id))
 
     return QuerySubmitResponse(session_id=session.id, status="PROCESSING")
 
@@ -136,15 +207,15 @@ def poll_status(session_id: str, db: Session = Depends(get_db)) -> QueryStatusRe
     if not _validate_uuid(session_id):
         raise HTTPException(status_code=404, detail="Invalid session_id format")
     try:
-        session = QuerySessionRepository.get(db=db, session_id=session_id)
+        status = QuerySessionRepository.get_status(db=db, session_id=session_id)
     except (OperationalError, SQLAlchemyError):
         raise HTTPException(
             status_code=503,
             detail="Database temporarily unavailable. Please retry later."
         )
-    if session is None:
+    if status is None:
         raise HTTPException(status_code=404, detail="Unknown session_id")
-    return QueryStatusResponse(status=session.status)
+    return QueryStatusResponse(status=status)
 
 
 @router.get("/query/{session_id}/result", response_model=QueryResultResponse)
@@ -165,7 +236,7 @@ def fetch_result(session_id: str, db: Session = Depends(get_db)) -> QueryResultR
         raise HTTPException(status_code=409, detail="Result not ready")
 
     snapshot = AnswerSnapshotRepository.get_latest_by_session(db=db, session_id=session_id)
-    evidence_rows = EvidenceRepository.list_by_session(db=db, session_id=session_id)
+    evidence_rows = EvidenceRepository.list_items_by_session(db=db, session_id=session_id)
 
     answer_text = snapshot.answer_text if snapshot is not None else ""
     confidence_level = (
@@ -177,11 +248,11 @@ def fetch_result(session_id: str, db: Session = Depends(get_db)) -> QueryResultR
 
     evidence = [
         {
-            "claim": ev.claim_text,
-            "status": ev.verification_status,
-            "sources": ev.source_urls,
+            "claim": claim_text,
+            "status": verification_status,
+            "sources": source_urls,
         }
-        for ev in evidence_rows
+        for claim_text, verification_status, source_urls in evidence_rows
     ]
 
     notes: Optional[str] = None
@@ -209,12 +280,14 @@ def fetch_trace(
 
     if not _validate_uuid(session_id):
         raise HTTPException(status_code=404, detail="Invalid session_id format")
-    session = QuerySessionRepository.get(db=db, session_id=session_id)
+    session = QuerySessionRepository.get_with_children(
+        db, session_id, "planner_traces", "search_logs"
+    )
     if session is None:
         raise HTTPException(status_code=404, detail="Unknown session_id")
 
-    traces = PlannerTraceRepository.list_by_session(db=db, session_id=session_id)
-    logs = SearchLogRepository.list_by_session(db=db, session_id=session_id)
+    traces = session.planner_traces
+    logs = session.search_logs
 
     # TEA-safe: return only decisions/metadata (no prompts, no hidden reasoning)
     planner_traces = [
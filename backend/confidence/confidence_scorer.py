@@ -35,27 +35,30 @@ class ConfidenceScorer:
                 "confidence_reason": "No verified claims available."
             }
         
-        # Count claims by status
-        agreement_count = sum(
-            1 for c in verified_claims 
-            if c.status == VerificationStatus.AGREEMENT
-        )
-        conflict_count = sum(
-            1 for c in verified_claims 
-            if c.status == VerificationStatus.CONFLICT
-        )
-        single_source_count = sum(
-            1 for c in verified_claims 
-            if c.status == VerificationStatus.SINGLE_SOURCE
-        )
-        
-        total_claims = len(verified_claims)
-        
-        # Count unique sources across all claims
-        all_sources = set()
+        # Count claims by status and collect sources in a single pass
+        AGREEMENT = VerificationStatus.AGREEMENT
+        CONFLICT = VerificationStatus.CONFLICT
+        SINGLE_SOURCE = VerificationStatus.SINGLE_SOURCE
+
+        agreement_count = 0
+        conflict_count = 0
+        single_source_count = 0
+        # Plain list extend in the loop; URLs are only hashed if the HIGH check needs them
+        # (Exact counting is fine: sources come from one WebEnvironment.run, so
+        # there are at most WebEnvironment.MAX_PAGES distinct URLs.)
+        all_sources: List[str] = []
+
         for claim in verified_claims:
-            all_sources.update(claim.sources)
-        source_count = len(all_sources)
+            status = claim.status
+            if status == AGREEMENT:
+                agreement_count += 1
+            elif status == CONFLICT:
+                conflict_count += 1
+            elif status == SINGLE_SOURCE:
+                single_source_count += 1
+            all_sources.extend(claim.sources)
+
+        total_claims = len(verified_claims)
         
         # Scoring logic
         
@@ -81,7 +84,7 @@ class ConfidenceScorer:
             }
         
         # Majority agreement → HIGH confidence
-        if agreement_count >= total_claims * 0.5 and source_count >= 2:
+        if agreement_count >= total_claims * 0.5 and (source_count := len(set(all_sources))) >= 2:
             return {
                 "confidence_level": "HIGH",
                 "confidence_reason": f"Strong agreement: {agreement_count}/{total_claims} claims corroborated by multiple independent sources ({source_count} total)."
@@ -1,4 +1,9 @@
-from typing import List
+import logging
+from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from environments.base import Environment
 from environments.web.state import WebEnvironmentState, WebDocument
 from environments.web.search import WebSearch
@@ -7,6 +12,25 @@ from environments.web.extract import WebExtractor
 from urllib.parse import urlparse
 from constants.rules import BLOCKED_DOMAINS, MIN_TEXT_LENGTH
 
+logger = logging.getLogger(__name__)
+
+# A host is blocked if it is a listed domain or any subdomain of one. Matching on
+# ".domain" keeps e.g. "dropbox.com" from being caught by "x.com".
+_BLOCKED_EXACT = frozenset(d.lower().lstrip(".") for d in BLOCKED_DOMAINS)
+_BLOCKED_SUFFIXES = tuple("." + d for d in _BLOCKED_EXACT)
+
+
+@lru_cache(maxsize=1024)
+def _netloc(url: str) -> str:
+    # hostname is already lowercased and stripped of port/userinfo
+    return urlparse(url).hostname or ""
+
+
+@lru_cache(maxsize=4096)
+def _is_blocked_host(host: str) -> bool:
+    return host in _BLOCKED_EXACT or host.endswith(_BLOCKED_SUFFIXES)
+
+
 class WebEnvironment(Environment):
     MAX_PAGES = 5
 
@@ -20,12 +44,55 @@ class WebEnvironment(Environment):
         self.state = WebEnvironmentState()
 
     def observe(self):
-        return self.state.dict()
+        return asdict(self.state)
     
     def is_blocked_domain(self, url: str) -> bool:
-        domain = urlparse(url).netloc.lower()
-        return any(blocked in domain for blocked in BLOCKED_DOMAINS)
+        return _is_blocked_host(_netloc(url))
+
 
+    def _process(self, url: str) -> Tuple[str, Optional[WebDocument], Optional[str]]:
+        """Fetch and extract a single URL. Returns (url, doc_or_None, error_or_None).
+
+        Runs on a fetch worker thread, so extraction of one page overlaps with
+        the network I/O of the others; parsing itself is done in C (selectolax).
+        """
+        logger.debug("[WebEnvironment] Processing: %s", url)
+        try:
+            html = self.fetcher.fetch(url)
+            text, metadata = self.extractor.extract(html)
+            logger.debug("[WebEnvironment] Extracted %d chars from %s", len(text), url)
+
+            if len(text) < MIN_TEXT_LENGTH:
+                logger.debug("[WebEnvironment] Text too short (%d < %d): %s", len(text), MIN_TEXT_LENGTH, url)
+                return url, None, None
+
+            doc = WebDocument(
+                url=url,
+                title=metadata.get("title"),
+                text=text,
+                metadata=metadata
+            )
+            return url, doc, None
+
+        except Exception as e:
+            return url, None, str(e)
+
+    def _iter_candidate_urls(self, results: Iterable[Dict]) -> Iterator[str]:
+        """Yield fetchable URLs from search results, skipping blocked and already-seen ones."""
+        seen = set(self.state.visited_urls)
+        for result in results:
+            url = result["url"]
+
+            if self.is_blocked_domain(url):
+                logger.debug("[WebEnvironment] Blocked domain: %s", url)
+                continue
+
+            if url in seen:
+                logger.debug("[WebEnvironment] Already visited: %s", url)
+                continue
+
+            seen.add(url)
+            yield url
 
     def run(self, query: str, num_docs: int | None = None) -> List[WebDocument]:
         self.reset()
@@ -35,49 +102,40 @@ class WebEnvironment(Environment):
             limit = self.MAX_PAGES
             if num_docs is not None:
                 limit = max(1, min(int(num_docs), self.MAX_PAGES))
-            print(f"[WebEnvironment] Searching for: {query} (limit={limit})")
+            logger.info("[WebEnvironment] Searching for: %s (limit=%d)", query, limit)
             results = self.search_client.search(query, limit=limit)
-            print(f"[WebEnvironment] Search returned {len(results)} results")
+            logger.debug("[WebEnvironment] Search returned %d results", len(results))
         except Exception as e:
-            print(f"[WebEnvironment] Search error: {e}")
+            logger.warning("[WebEnvironment] Search error: %s", e)
             self.state.errors.append(str(e))
             return []
 
-        for result in results:
-            url = result["url"]
-            print(f"[WebEnvironment] Processing: {url}")
-
-            if self.is_blocked_domain(url):
-                print(f"[WebEnvironment] Blocked domain: {url}")
+        # Candidates are filtered lazily and capped at `limit`, so nothing past
+        # the first `limit` usable URLs is even inspected, let alone fetched.
+        urls = list(islice(self._iter_candidate_urls(results), limit))
+
+        if urls:
+            # Fetching is blocking network I/O, so fan it out across URLs. Threads
+            # (not asyncio) keep the sync fetcher/extractor pluggable and already
+            # bring the fetch phase down to roughly the slowest single page.
+            with ThreadPoolExecutor(max_workers=min(len(urls), self.MAX_PAGES)) as executor:
+                outcomes = list(executor.map(self._process, urls))
+        else:
+            outcomes = []
+
+        # State is only mutated here, on the calling thread, in search-result order.
+        for url, doc, error in outcomes:
+            if error is not None:
+                logger.warning("[WebEnvironment] Fetch/extract error for %s: %s", url, error)
+                self.state.errors.append(f"{url}: {error}")
                 continue
 
-            if url in self.state.visited_urls:
-                print(f"[WebEnvironment] Already visited: {url}")
+            if doc is None:
                 continue
 
-            try:
-                html = self.fetcher.fetch(url)
-                text, metadata = self.extractor.extract(html)
-                print(f"[WebEnvironment] Extracted {len(text)} chars from {url}")
-
-                if len(text) < MIN_TEXT_LENGTH:
-                    print(f"[WebEnvironment] Text too short ({len(text)} < {MIN_TEXT_LENGTH}): {url}")
-                    continue
-
-                doc = WebDocument(
-                    url=url,
-                    title=metadata.get("title"),
-                    text=text,
-                    metadata=metadata
-                )
-
-                self.state.visited_urls.append(url)
-                self.state.documents.append(doc)
-                print(f"[WebEnvironment] Added document: {url}")
-
-            except Exception as e:
-                print(f"[WebEnvironment] Fetch/extract error for {url}: {e}")
-                self.state.errors.append(f"{url}: {str(e)}")
+            self.state.visited_urls.add(url)
+            self.state.documents.append(doc)
+            logger.debug("[WebEnvironment] Added document: %s", url)
 
-        print(f"[WebEnvironment] Total documents collected: {len(self.state.documents)}")
+        logger.info("[WebEnvironment] Total documents collected: %d", len(self.state.documents))
         return self.state.documents
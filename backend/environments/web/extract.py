@@ -1,18 +1,86 @@
+import hashlib
+
 from bs4 import BeautifulSoup
 
+from utils.ttl_cache import TTLCache
+
+try:
+    # lexbor parses and walks the tree in C; much faster than building a bs4 tree
+    from selectolax.lexbor import LexborHTMLParser  # type: ignore
+except Exception:
+    LexborHTMLParser = None
+
+
+def _html_parser() -> str:
+    try:
+        # C-backed parser, several times faster than the pure-Python one
+        import lxml  # type: ignore  # noqa: F401
+
+        return "lxml"
+    except Exception:
+        return "html.parser"
+
+
+HTML_PARSER = _html_parser()
+
+# Keyed by a digest of the HTML so identical pages are only parsed once.
+_EXTRACT_CACHE = TTLCache(maxsize=256, ttl=3600)
+
 
 class WebExtractor:
     def extract(self, html: str) -> tuple[str, dict]:
-        soup = BeautifulSoup(html, "html.parser")
+        key = hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        cached = _EXTRACT_CACHE.get(key)
+        if cached is not None:
+            text, metadata = cached
+            # Callers may annotate metadata; never hand out the cached dict.
+            return text, dict(metadata)
+
+        if LexborHTMLParser is not None:
+            text, metadata = self._extract_lexbor(html)
+        else:
+            text, metadata = self._extract_bs4(html)
+
+        _EXTRACT_CACHE.put(key, (text, dict(metadata)))
+        return text, metadata
+
+    def _extract_lexbor(self, html: str) -> tuple[str, dict]:
+        tree = LexborHTMLParser(html)
+
+        # Remove scripts & styles in one C-level pass
+        tree.strip_tags(["script", "style", "noscript"])
+
+        # Collected natively in C. text(strip=True) still emits a separator for
+        # whitespace-only nodes, so join on NUL (never present in parsed text)
+        # and drop the empty fragments: the same pieces as bs4's
+        # stripped_strings, at the cost of one str.split.
+        root = tree.root
+        raw = root.text(separator="\x00", strip=True) if root is not None else ""
+        text = " ".join(filter(None, raw.split("\x00")))
+
+        metadata = {}
+        title_node = tree.css_first("title")
+        title = title_node.text(strip=True) if title_node else None
+        if title:
+            metadata["title"] = title
+
+        return text, metadata
+
+    def _extract_bs4(self, html: str) -> tuple[str, dict]:
+        soup = BeautifulSoup(html, HTML_PARSER)
 
         # Remove scripts & styles
         for tag in soup(["script", "style", "noscript"]):
             tag.decompose()
 
+        # str.join sizes its buffer once; a StringIO write loop would only add
+        # per-fragment Python calls on this (fallback) path.
         text = " ".join(soup.stripped_strings)
 
         metadata = {}
-        title = soup.title.string if soup.title else None
+        # get_text(), not .string: html.parser parses markup inside <title>
+        # into child tags, where .string is None. Stripped like the lexbor path.
+        title = soup.title.get_text().strip() if soup.title else None
         if title:
             metadata["title"] = title
 
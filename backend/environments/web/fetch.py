@@ -1,16 +1,91 @@
+import random
+import time
+from functools import lru_cache
+
 import requests
-from tenacity import retry, stop_after_attempt, wait_fixed
+from requests.adapters import HTTPAdapter
+from requests.compat import chardet
+
+from utils.ttl_cache import TTLCache
+
+# Planner retries re-run overlapping searches; repeated URLs are served from
+# memory instead of being fetched again. ~256 pages bounds this to tens of MB.
+_HTML_CACHE = TTLCache(maxsize=256, ttl=3600)
+
+
+def pooled_session() -> requests.Session:
+    """Session with a keep-alive pool big enough for concurrent page fetches.
+
+    Retries stay off at the transport level; callers decide how to retry.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
+def shared_session() -> requests.Session:
+    """Process-wide pooled session.
+
+    A WebEnvironment (and its fetcher) is built per query, so a per-instance
+    session would drop its warm connections after every query.
+    """
+    return pooled_session()
 
 
 class WebFetcher:
-    def __init__(self, timeout: int = 8):
-        self.timeout = timeout
+    MAX_ATTEMPTS = 3
+    BACKOFF_BASE = 0.5  # seconds; doubles per attempt, plus up to 0.25s jitter
+    # Only page text is kept downstream; anything past this is never read.
+    MAX_BYTES = 2_000_000
 
-    @retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
-    def fetch(self, url: str) -> str:
-        headers = {
+    def __init__(self, timeout: int = 8, session: requests.Session | None = None):
+        self.timeout = timeout
+        # Keep-alive connections are reused across pages, planner attempts and
+        # queries instead of re-handshaking.
+        self.session = session or shared_session()
+        self.headers = {
             "User-Agent": "TEA-Research-Agent/1.0"
         }
-        response = requests.get(url, headers=headers, timeout=self.timeout)
-        response.raise_for_status()
-        return response.text
+
+    def fetch(self, url: str) -> str:
+        cached = _HTML_CACHE.get(url)
+        if cached is not None:
+            return cached
+
+        for attempt in range(self.MAX_ATTEMPTS):
+            try:
+                html = self._get_capped(url)
+                _HTML_CACHE.put(url, html)
+                return html
+            except requests.RequestException:
+                if attempt == self.MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep(self.BACKOFF_BASE * (2 ** attempt) + random.random() * 0.25)
+
+    def _get_capped(self, url: str) -> str:
+        """GET `url`, reading at most MAX_BYTES of the body before decoding."""
+        with self.session.get(
+            url, headers=self.headers, timeout=self.timeout, stream=True
+        ) as response:
+            response.raise_for_status()
+
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(chunk_size=65536):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= self.MAX_BYTES:
+                    break
+
+            raw = b"".join(chunks)[: self.MAX_BYTES]
+            # Same fallback as Response.text: with no charset from the headers,
+            # sniff one from the (capped) bytes instead of assuming UTF-8.
+            encoding = response.encoding or chardet.detect(raw)["encoding"] or "utf-8"
+            try:
+                return raw.decode(encoding, errors="replace")
+            except LookupError:
+                # Unknown codec name in the Content-Type header
+                return raw.decode("utf-8", errors="replace")
@@ -1,13 +1,21 @@
-import requests
 import os
 import json
 from typing import List, Dict
+from environments.web.fetch import shared_session
+
+try:
+    # Rust JSON parser; reads the raw bytes directly, no str decode step
+    from orjson import loads as _json_loads  # type: ignore
+except Exception:
+    _json_loads = json.loads
 
 class WebSearch:
     def __init__(self, api_key: str, endpoint: str, cx: str):
         self.api_key = api_key
         self.endpoint = endpoint
         self.cx = cx
+        # Every search hits the same few hosts; reuse their connections.
+        self.session = shared_session()
 
     def search(self, query: str, limit: int = 5) -> List[Dict]:
         # Check if API credentials are configured
@@ -22,10 +30,10 @@ class WebSearch:
                 "q": query,
                 "num": limit
             }
-            response = requests.get(self.endpoint, params=params, timeout=10)
+            response = self.session.get(self.endpoint, params=params, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            data = _json_loads(response.content)
             items = data.get("items", [])
             results = [
                 {"url": item.get("link"), "title": item.get("title", "")}
@@ -75,7 +83,7 @@ class WebSearch:
             "Accept-Language": "en-US,en;q=0.5",
         }
         
-        response = requests.post(
+        response = self.session.post(
             "https://lite.duckduckgo.com/lite/",
             data={"q": query},
             headers=headers,
@@ -84,7 +92,8 @@ class WebSearch:
         response.raise_for_status()
         
         from bs4 import BeautifulSoup
-        soup = BeautifulSoup(response.text, "html.parser")
+        from environments.web.extract import HTML_PARSER
+        soup = BeautifulSoup(response.text, HTML_PARSER)
         
         results = []
         # DuckDuckGo Lite uses tables for results
@@ -120,7 +129,7 @@ class WebSearch:
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         }
         
-        response = requests.get(
+        response = self.session.get(
             "https://www.bing.com/search",
             params={"q": query},
             headers=headers,
@@ -129,7 +138,8 @@ class WebSearch:
         response.raise_for_status()
         
         from bs4 import BeautifulSoup
-        soup = BeautifulSoup(response.text, "html.parser")
+        from environments.web.extract import HTML_PARSER
+        soup = BeautifulSoup(response.text, HTML_PARSER)
         
         results = []
         for item in soup.select("li.b_algo h2 a")[:limit]:
@@ -145,7 +155,7 @@ class WebSearch:
 
     def _wikipedia_search(self, query: str, limit: int) -> List[Dict]:
         """Use Wikipedia API for factual queries"""
-        response = requests.get(
+        response = self.session.get(
             "https://en.wikipedia.org/w/api.php",
             params={
                 "action": "opensearch",
@@ -158,7 +168,7 @@ class WebSearch:
         )
         response.raise_for_status()
         
-        data = response.json()
+        data = _json_loads(response.content)
         # OpenSearch returns [query, [titles], [descriptions], [urls]]
         if len(data) >= 4:
             titles = data[1]
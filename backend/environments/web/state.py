@@ -1,16 +1,20 @@
-from typing import List, Dict
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from typing import List, Dict, Set
 
 
-class WebDocument(BaseModel):
+# Plain dataclasses: these are internal, built only by WebEnvironment from
+# already-typed values, so per-instance validation would be pure overhead.
+@dataclass(slots=True)
+class WebDocument:
     url: str
-    title: str | None = None
     text: str
-    metadata: Dict[str, str] = Field(default_factory=dict)
+    title: str | None = None
+    metadata: Dict[str, str] = field(default_factory=dict)
 
 
-class WebEnvironmentState(BaseModel):
+@dataclass(slots=True)
+class WebEnvironmentState:
     query: str | None = None
-    visited_urls: List[str] = Field(default_factory=list)
-    documents: List[WebDocument] = Field(default_factory=list)
-    errors: List[str] = Field(default_factory=list)
+    visited_urls: Set[str] = field(default_factory=set)
+    documents: List[WebDocument] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
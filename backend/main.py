@@ -1,3 +1,5 @@
+import logging
+import os
 import sys
 from pathlib import Path
 
@@ -12,6 +14,14 @@ if str(BACKEND_DIR) not in sys.path:
 from backend.api.routes import router as api_router
 from backend.storage.db import init_db
 
+# Research/web progress goes through `logging`, but uvicorn only configures its
+# own loggers. Give the root a handler and raise just the app's packages
+# (imported both as `backend.*` and via the historical top-level names) to
+# LOG_LEVEL; third-party loggers such as httpx stay at WARNING.
+logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+for _name in ("backend", "agents", "environments", "planner"):
+	logging.getLogger(_name).setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
 app = FastAPI(title="AI Research Agent API", version="1.0.0")
 
 # CORS middleware - allow frontend origins
@@ -1,7 +1,7 @@
 from enum import Enum
 import hashlib
-import re
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
 from agents.VerificationAgent import VerificationAgent, VerificationDecision
 from storage.repositories.query_session_repo import QuerySessionRepository
 from storage.repositories.planner_trace_repo import PlannerTraceRepository
@@ -12,6 +12,22 @@ from sqlalchemy.orm import Session
 from storage.repositories.evidence_repo import EvidenceRepository
 
 
+def _normalize_question(question: str) -> str:
+    # Collapses whitespace runs and trims the ends; split() matches the same
+    # str.isspace() set as r"\s+" without going through the regex engine.
+    return " ".join(question.lower().split())
+
+
+@lru_cache(maxsize=1024)
+def _query_hash(normalized_question: str, strategy: str, num_docs: int) -> bytes:
+    # Pure function of primitives, so retries of the same (question, strategy,
+    # num_docs) triple skip re-encoding and re-hashing. The digest is only a
+    # content-addressed cache key (not a security boundary), so BLAKE2b-128
+    # is plenty; the raw 16 bytes are stored as the query_cache key.
+    key = f"{normalized_question}|{strategy}|{num_docs}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+
 
 class PlannerState(Enum):
     INIT = "INIT"
@@ -34,6 +50,27 @@ class PlannerContext:
     Budget constraints removed for unlimited research capability.
     """
 
+    # One context per planner run; no per-instance __dict__
+    __slots__ = (
+        "current_state",
+        "attempt_count",
+        "max_attempts",
+        "confidence_history",
+        "decision_history",
+        "strategy_history",
+        "used_strategies",
+        "current_strategy",
+        "last_confidence",
+        "final_result",
+        "no_progress_count",
+        "last_decision",
+        "num_docs",
+        "max_docs",
+        "search_count",
+        "max_searches",
+        "budget_exhausted_reason",
+    )
+
     def __init__(self, max_attempts: int = 10):
         self.current_state: PlannerState = PlannerState.INIT
         self.attempt_count: int = 0
@@ -43,6 +80,8 @@ class PlannerContext:
         self.decision_history: List[str] = []
 
         self.strategy_history: List[SearchStrategy] = []
+        # Same entries as strategy_history, for O(1) "already tried?" checks
+        self.used_strategies: Set[SearchStrategy] = set()
         self.current_strategy: SearchStrategy = SearchStrategy.BASE
 
         self.last_confidence: Optional[str] = None
@@ -73,6 +112,7 @@ class PlannerContext:
 
     def record_strategy(self, strategy: SearchStrategy):
         self.strategy_history.append(strategy)
+        self.used_strategies.add(strategy)
         self.current_strategy = strategy
 
     def record_progress(self, confidence: str, decision: str):
@@ -118,12 +158,25 @@ class PlannerAgent:
         self.evidence_repo = EvidenceRepository
         self.session_id = None
         self._research_result: Optional[Dict] = None
-        self._last_query_hash: Optional[str] = None
+        self._last_query_hash: Optional[bytes] = None
+        self._last_persisted_status: Optional[str] = None
 
-    def _compute_query_hash(self, question: str, strategy: str, num_docs: int) -> str:
-        normalized_question = re.sub(r"\s+", " ", question.strip().lower())
-        key = f"{normalized_question}|{strategy}|{num_docs}"
-        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+    def _compute_query_hash(self, question: str, strategy: str, num_docs: int) -> bytes:
+        # Normalizing is a cheap split/join; _query_hash memoizes the digest.
+        return _query_hash(_normalize_question(question), strategy, num_docs)
+
+    def _persist_status(self, state: PlannerState) -> None:
+        """Write the session status, skipping writes that would not change it."""
+        if self.db is None or self.session_id is None:
+            return
+        if state.value == self._last_persisted_status:
+            return
+        self.query_repo.update_status(
+            db=self.db,
+            session_id=self.session_id,
+            status=state.value,
+        )
+        self._last_persisted_status = state.value
 
     def run(self, question: str) -> Dict:
         while True:
@@ -185,27 +238,21 @@ class PlannerAgent:
         self.context.attempt_count = 1
         self.context.current_strategy = SearchStrategy.BASE
         self.context.current_state = PlannerState.RESEARCH
-        if self.db is not None and self.session_id is not None:
-            self.query_repo.update_status(
-                db=self.db,
-                session_id=self.session_id,
-                status=PlannerState.RESEARCH.value,
-            )
+        self._persist_status(PlannerState.RESEARCH)
 
     def _handle_research(self, question: str):
-        if self.db is not None and self.session_id is not None:
-            self.query_repo.update_status(
-                db=self.db,
-                session_id=self.session_id,
-                status=PlannerState.RESEARCH.value,
-            )
+        self._persist_status(PlannerState.RESEARCH)
         self._last_query_hash = self._compute_query_hash(
             question=question,
             strategy=self.context.current_strategy.value,
             num_docs=self.context.num_docs,
         )
 
-        # Cache lookup happens only on retries (not first attempt)
+        # Cache lookup happens only on retries (not first attempt). Matching is
+        # exact on (question, strategy, num_docs): a result is only reusable
+        # for the same retry strategy, so an embedding-similarity tier keyed on
+        # the question alone would return answers from the wrong strategy, and
+        # would add an embedding call to every lookup.
         if self.db is not None and self.context.attempt_count > 1:
             cache = self.cache_repo.get_valid(
                 db=self.db,
@@ -217,7 +264,7 @@ class PlannerAgent:
                     session_id=cache.session_id,
                 )
                 if cached_snapshot is not None:
-                    cached_evidence = self.evidence_repo.list_by_session(
+                    cached_evidence = self.evidence_repo.list_items_by_session(
                         db=self.db,
                         session_id=cache.session_id,
                     )
@@ -227,22 +274,21 @@ class PlannerAgent:
                         "confidence_reason": cached_snapshot.confidence_reason,
                         "evidence": [
                             {
-                                "claim": ev.claim_text,
-                                "status": ev.verification_status,
-                                "sources": ev.source_urls,
+                                "claim": claim_text,
+                                "status": verification_status,
+                                "sources": source_urls,
                             }
-                            for ev in cached_evidence
+                            for claim_text, verification_status, source_urls in cached_evidence
                         ],
                     }
                     self.context.current_state = PlannerState.VERIFY
-                    if self.db is not None and self.session_id is not None:
-                        self.query_repo.update_status(
-                            db=self.db,
-                            session_id=self.session_id,
-                            status=PlannerState.VERIFY.value,
-                        )
+                    self._persist_status(PlannerState.VERIFY)
                     return
 
+            # End the lookup's read transaction so the session does not pin a
+            # pooled connection through research (search + LLM calls).
+            self.db.rollback()
+
         # No cache hit -> proceed with normal research
         self.context.search_count += 1
         # Budget check removed - allow unlimited searches
@@ -255,31 +301,23 @@ class PlannerAgent:
             num_docs=self.context.num_docs
     )  
         if self.db is not None and self.session_id is not None:
+            # Committed together with the VERIFY status update below.
             self.search_repo.log(
                 db=self.db,
                 session_id=self.session_id,
                 attempt_number=self.context.attempt_count,
                 query_used=query_used,
                 num_docs=self.context.num_docs,
-                success=True
+                success=True,
+                commit=False
             )
         self.context.current_state = PlannerState.VERIFY
-        if self.db is not None and self.session_id is not None:
-            self.query_repo.update_status(
-                db=self.db,
-                session_id=self.session_id,
-                status=PlannerState.VERIFY.value,
-            )
+        self._persist_status(PlannerState.VERIFY)
 
 
     # VERIFY → SYNTHESIZE
     def _handle_verify(self, question: str):
-        if self.db is not None and self.session_id is not None:
-            self.query_repo.update_status(
-                db=self.db,
-                session_id=self.session_id,
-                status=PlannerState.VERIFY.value,
-            )
+        self._persist_status(PlannerState.VERIFY)
         confidence_level = self._research_result.get("confidence_level", "LOW")
         confidence_reason = self._research_result.get("confidence_reason", "")
 
@@ -295,48 +333,41 @@ class PlannerAgent:
             max_attempts=self.context.max_attempts
         )
         if self.db is not None and self.session_id is not None:
+            # Every branch below ends in a status write (SYNTHESIZE, RESEARCH
+            # or the FAILED final status), which commits the trace with it.
             self.trace_repo.log(
                 db=self.db,
                 session_id=self.session_id,
                 attempt_number=self.context.attempt_count,
                 planner_state=self.context.current_state.value,
-                verification_decision=decision["decision"],
+                verification_decision=decision.decision,
                 strategy_used=self.context.current_strategy.value,
                 num_docs=self.context.num_docs,
-                stop_reason=decision.get("reason")
+                stop_reason=decision.reason,
+                commit=False
             )
 
-        self.context.record_decision(decision["decision"])
-        self.context.record_progress(confidence_level, decision["decision"])
+        self.context.record_decision(decision.decision)
+        self.context.record_progress(confidence_level, decision.decision)
 
 
         # ACCEPT → SYNTHESIZE
-        if decision["decision"] == VerificationDecision.ACCEPT:
+        if decision.decision == VerificationDecision.ACCEPT:
             self.context.current_state = PlannerState.SYNTHESIZE
-            if self.db is not None and self.session_id is not None:
-                self.query_repo.update_status(
-                    db=self.db,
-                    session_id=self.session_id,
-                    status=PlannerState.SYNTHESIZE.value,
-                )
+            self._persist_status(PlannerState.SYNTHESIZE)
             return
 
         # STOP → SYNTHESIZE (low confidence)
-        if decision["decision"] == VerificationDecision.STOP:
+        if decision.decision == VerificationDecision.STOP:
             self.context.current_state = PlannerState.SYNTHESIZE
             if self._research_result:
-                self._research_result["notes"] = decision["reason"]
-            if self.db is not None and self.session_id is not None:
-                self.query_repo.update_status(
-                    db=self.db,
-                    session_id=self.session_id,
-                    status=PlannerState.SYNTHESIZE.value,
-                )
+                self._research_result["notes"] = decision.reason
+            self._persist_status(PlannerState.SYNTHESIZE)
             return
 
         # RETRY → modify strategy and loop
         
-        if decision["decision"] == VerificationDecision.RETRY:
+        if decision.decision == VerificationDecision.RETRY:
             # Stop BEFORE incrementing so attempt_count reflects attempts actually executed.
             if self._should_stop():
                 self.context.current_state = PlannerState.FAILED
@@ -351,14 +382,9 @@ class PlannerAgent:
                     self.context.max_docs
                 )
            
-            self._update_strategy(confidence_reason, decision.get("recommendation"))
+            self._update_strategy(confidence_reason, decision.recommendation)
             self.context.current_state = PlannerState.RESEARCH
-            if self.db is not None and self.session_id is not None:
-                self.query_repo.update_status(
-                    db=self.db,
-                    session_id=self.session_id,
-                    status=PlannerState.RESEARCH.value,
-                )
+            self._persist_status(PlannerState.RESEARCH)
             return
         
 
@@ -367,12 +393,7 @@ class PlannerAgent:
     def _handle_synthesize(self):
         result = self._research_result
 
-        if self.db is not None and self.session_id is not None:
-            self.query_repo.update_status(
-                db=self.db,
-                session_id=self.session_id,
-                status=PlannerState.SYNTHESIZE.value,
-            )
+        self._persist_status(PlannerState.SYNTHESIZE)
 
         if result is None:
             self.context.budget_exhausted_reason = "No research result available to synthesize."
@@ -380,43 +401,52 @@ class PlannerAgent:
             return
 
         if self.db is not None and self.session_id is not None:
-            self.answer_repo.create(
-                db=self.db,
-                session_id=self.session_id,
-                answer_text=result["answer"],
-                confidence_level=result["confidence_level"],
-                confidence_reason=result["confidence_reason"]
-            )
+            # Answer, evidence, final status and cache entry are written in one
+            # transaction: a single commit, and never a half-persisted result.
+            try:
+                self.answer_repo.create(
+                    db=self.db,
+                    session_id=self.session_id,
+                    answer_text=result["answer"],
+                    confidence_level=result["confidence_level"],
+                    confidence_reason=result["confidence_reason"],
+                    commit=False,
+                )
 
-        if self.db is not None and self.session_id is not None and result.get("evidence"):
-            self.evidence_repo.bulk_create(
-                db=self.db,
-                session_id=self.session_id,
-                evidence_items=result["evidence"],
-            )
+                if result.get("evidence"):
+                    self.evidence_repo.bulk_create(
+                        db=self.db,
+                        session_id=self.session_id,
+                        evidence_items=result["evidence"],
+                        commit=False,
+                    )
 
-        if self.db is not None and self.session_id is not None:
-            self.query_repo.update_final_status(
-                db=self.db,
-                session_id=self.session_id,
-                status="DONE",
-                confidence_level=result["confidence_level"],
-                confidence_reason=result["confidence_reason"]
-            )
+                self.query_repo.update_final_status(
+                    db=self.db,
+                    session_id=self.session_id,
+                    status="DONE",
+                    confidence_level=result["confidence_level"],
+                    confidence_reason=result["confidence_reason"],
+                    commit=False,
+                )
 
-        # Store cache only on ACCEPT (never on STOP)
-        if (
-            self.db is not None
-            and self.session_id is not None
-            and self.context.last_decision == VerificationDecision.ACCEPT
-            and self._last_query_hash
-        ):
-            self.cache_repo.store(
-                db=self.db,
-                query_hash=self._last_query_hash,
-                session_id=self.session_id,
-                ttl_seconds=60 * 60 * 24,
-            )
+                # Store cache only on ACCEPT (never on STOP)
+                if (
+                    self.context.last_decision == VerificationDecision.ACCEPT
+                    and self._last_query_hash
+                ):
+                    self.cache_repo.store(
+                        db=self.db,
+                        query_hash=self._last_query_hash,
+                        session_id=self.session_id,
+                        ttl_seconds=60 * 60 * 24,
+                        commit=False,
+                    )
+
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
 
         self.context.final_result = self._research_result
         self.context.current_state = PlannerState.DONE
@@ -426,13 +456,14 @@ class PlannerAgent:
     confidence_reason: str,
     recommendation: Optional[str]
 ):
-        used = set(self.context.strategy_history)
+        used = self.context.used_strategies
+        reason = confidence_reason.lower()
 
         #  Primary selection (intent-based)
-        if "single source" in confidence_reason.lower():
+        if "single source" in reason:
             preferred = SearchStrategy.BROADEN_QUERY
 
-        elif "conflict" in confidence_reason.lower():
+        elif "conflict" in reason:
             preferred = SearchStrategy.AUTHORITATIVE_SITES
 
         elif recommendation:
@@ -1,7 +1,8 @@
 import os
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from storage.base import Base
 
@@ -16,15 +17,40 @@ DATABASE_URL = os.getenv(
 # Ensure models are imported so Base.metadata has tables.
 from storage import models as _models  # noqa: F401
 
+# pool_size + max_overflow is per process; keep (workers * that) under the
+# server's max_connections.
 engine_kwargs = {
     "echo": False,
-    "pool_pre_ping": True,
-    "pool_size": 20,           # Base pool connections
-    "max_overflow": 30,        # Extra connections under load
+    "pool_pre_ping": os.getenv("DB_PRE_PING", "1") == "1",    # Liveness probe per checkout
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),        # Base pool connections
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),  # Extra connections under load
+    "pool_use_lifo": True,     # Reuse the most recently returned (warm) connection
     "pool_timeout": 60,        # Wait up to 60s for a connection
     "pool_recycle": 1800,      # Recycle connections every 30 min
+    "query_cache_size": 1200,  # Compiled-statement cache entries
 }
 
+if DATABASE_URL.startswith("postgresql"):
+    engine_kwargs["connect_args"] = {
+        "options": "-c statement_timeout=60000",
+        "keepalives": 1,
+        "keepalives_idle": 30,
+    }
+
+# Batch executemany INSERTs (e.g. evidence rows) into multi-row VALUES pages.
+if DATABASE_URL.startswith("postgresql+psycopg2"):
+    engine_kwargs["executemany_mode"] = "values_plus_batch"
+    engine_kwargs["insertmanyvalues_page_size"] = 500
+
+# JSON columns (evidence.source_urls) go through orjson when it is installed.
+try:
+    import orjson  # type: ignore
+
+    engine_kwargs["json_serializer"] = lambda value: orjson.dumps(value).decode("utf-8")
+    engine_kwargs["json_deserializer"] = orjson.loads
+except Exception:
+    pass
+
 # Allow local runs without Postgres by setting DATABASE_URL to sqlite.
 if DATABASE_URL.startswith("sqlite"):
     engine_kwargs["connect_args"] = {"check_same_thread": False}
@@ -32,8 +58,29 @@ if DATABASE_URL.startswith("sqlite"):
     engine_kwargs.pop("pool_size", None)
     engine_kwargs.pop("max_overflow", None)
     engine_kwargs.pop("pool_recycle", None)
+    engine_kwargs.pop("pool_use_lifo", None)
+    # An in-memory database lives and dies with its connection: share one
+    # connection so every session sees the same tables.
+    if DATABASE_URL in ("sqlite://", "sqlite:///:memory:"):
+        engine_kwargs["poolclass"] = StaticPool
+        engine_kwargs.pop("pool_timeout", None)
 
 engine = create_engine(DATABASE_URL, **engine_kwargs)
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _sqlite_pragmas(dbapi_conn, _record):
+        # WAL lets status polls read while the planner writes; NORMAL skips
+        # the fsync per commit (still durable across app crashes in WAL).
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        # SQLite ignores FOREIGN KEY clauses (and so ON DELETE CASCADE, which
+        # QuerySession's passive_deletes relationships rely on) unless enabled.
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
@@ -1,5 +1,6 @@
 import uuid
-from sqlalchemy import Column, Text, String, DateTime, ForeignKey
+from sqlalchemy import Column, Text, String, DateTime, ForeignKey, Index, desc
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 
 from storage.base import Base
@@ -8,6 +9,10 @@ from storage.models.query_session import UUID_COL_TYPE
 
 class AnswerSnapshot(Base):
     __tablename__ = "answer_snapshots"
+    __table_args__ = (
+        # get_latest_by_session: filter by session, newest first, LIMIT 1
+        Index("ix_answer_snap_session_created", "session_id", desc("created_at")),
+    )
 
     id = Column(
         UUID_COL_TYPE,
@@ -36,10 +41,11 @@ class AnswerSnapshot(Base):
         nullable=False
     )
 
-    notes = Column(
+    # Deferred: /result and cache hits read the answer and confidence only.
+    notes = deferred(Column(
         Text,
         nullable=True
-    )
+    ))
 
     created_at = Column(
         DateTime(timezone=True),
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import JSON, Column, ForeignKey, String, Text
+from sqlalchemy import JSON, Column, ForeignKey, Index, String, Text
 
 from storage.base import Base
 from storage.models.query_session import UUID_COL_TYPE
@@ -7,6 +7,9 @@ from storage.models.query_session import UUID_COL_TYPE
 
 class Evidence(Base):
     __tablename__ = "evidence"
+    __table_args__ = (
+        Index("ix_evidence_session", "session_id"),
+    )
 
     id = Column(
         UUID_COL_TYPE,
@@ -1,5 +1,6 @@
 import uuid
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 
 from storage.base import Base
@@ -8,6 +9,16 @@ from storage.models.query_session import UUID_COL_TYPE
 
 class PlannerTrace(Base):
     __tablename__ = "planner_traces"
+    # Not partitioned: RANGE (created_at) would force created_at into the
+    # primary key and need partitions provisioned before any insert, and
+    # session reads (which never filter on created_at) would not prune.
+    # ix_planner_trace_session_attempt already bounds list_by_session to the
+    # session's own rows. Revisit once the table is large enough to need
+    # time-based retention.
+    __table_args__ = (
+        # list_by_session: filter by session, ordered by attempt
+        Index("ix_planner_trace_session_attempt", "session_id", "attempt_number"),
+    )
 
     id = Column(
         UUID_COL_TYPE,
@@ -46,10 +57,11 @@ class PlannerTrace(Base):
         nullable=True
     )
 
-    stop_reason = Column(
+    # Deferred: /trace never returns it.
+    stop_reason = deferred(Column(
         Text,
         nullable=True
-    )
+    ))
 
     created_at = Column(
         DateTime(timezone=True),
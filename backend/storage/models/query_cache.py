@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Text, DateTime, ForeignKey
+from sqlalchemy import Column, LargeBinary, DateTime, ForeignKey
 
 from storage.base import Base
 from storage.models.query_session import UUID_COL_TYPE
@@ -7,8 +7,10 @@ from storage.models.query_session import UUID_COL_TYPE
 class QueryCache(Base):
     __tablename__ = "query_cache"
 
+    # Raw BLAKE2b-128 digest of PlannerAgent's cache key: a fixed 16-byte
+    # key compares with a single memcmp and halves the index versus hex text.
     query_hash = Column(
-        Text,
+        LargeBinary(16),
         primary_key=True
     )
 
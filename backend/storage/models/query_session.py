@@ -1,11 +1,18 @@
 import uuid
 from sqlalchemy import Column, DateTime, String, Text
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
 from storage.base import Base
 
 
 def _uuid_col_type():
+    # Uuid renders as native UUID on Postgres (16-byte keys and FK compares)
+    # and CHAR(32) on SQLite. as_uuid=False keeps ids as canonical strings in
+    # Python, which is what the API returns; repositories str() incoming ids
+    # so callers may pass either str or uuid.UUID. Every in-tree caller
+    # already passes str, and str() of a str returns the same object, so
+    # the cast costs nothing on those paths.
     try:
         # SQLAlchemy 2.x portable UUID type
         from sqlalchemy import Uuid  # type: ignore
@@ -41,10 +48,12 @@ class QuerySession(Base):
         nullable=True
     )
 
-    final_confidence_reason = Column(
+    # Deferred: only read by /result on the fallback and FAILED paths, so
+    # session lookups (notably status polls) don't ship it.
+    final_confidence_reason = deferred(Column(
         Text,
         nullable=True
-    )
+    ))
 
     created_at = Column(
         DateTime(timezone=True),
@@ -52,3 +61,36 @@ class QuerySession(Base):
         nullable=False
     )
 
+    # Child collections are only loaded explicitly (selectinload); lazy="raise"
+    # turns any accidental per-row lazy load (N+1) into an immediate error.
+    # passive_deletes leaves child rows to the ON DELETE CASCADE declared on
+    # each child's session_id ForeignKey (present since the initial schema;
+    # SQLite enforces it via the foreign_keys pragma in storage.db).
+    snapshots = relationship(
+        "AnswerSnapshot",
+        order_by="AnswerSnapshot.created_at.desc()",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
+    evidence = relationship(
+        "Evidence",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
+    planner_traces = relationship(
+        "PlannerTrace",
+        order_by="PlannerTrace.attempt_number",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
+    search_logs = relationship(
+        "SearchLog",
+        order_by="SearchLog.attempt_number",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
+
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, Integer, Text, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Text, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 
 from storage.base import Base
@@ -7,6 +7,11 @@ from storage.models.query_session import UUID_COL_TYPE
 
 class SearchLog(Base):
     __tablename__ = "search_logs"
+    # Unpartitioned for the same reasons as planner_traces (see PlannerTrace).
+    __table_args__ = (
+        # list_by_session: filter by session, ordered by attempt
+        Index("ix_search_log_session_attempt", "session_id", "attempt_number"),
+    )
 
     id = Column(
         UUID_COL_TYPE,
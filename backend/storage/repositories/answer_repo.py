@@ -1,8 +1,17 @@
 import uuid
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from storage.models.answer_snapshot import AnswerSnapshot
 
 
+_SEL_LATEST_SNAPSHOT = (
+    select(AnswerSnapshot)
+    .where(AnswerSnapshot.session_id == bindparam("sid"))
+    .order_by(AnswerSnapshot.created_at.desc())
+    .limit(1)
+)
+
+
 class AnswerSnapshotRepository:
 
     @staticmethod
@@ -11,7 +20,8 @@ class AnswerSnapshotRepository:
         session_id,
         answer_text: str,
         confidence_level: str,
-        confidence_reason: str
+        confidence_reason: str,
+        commit: bool = True
     ):
         snapshot = AnswerSnapshot(
             id=str(uuid.uuid4()),
@@ -21,15 +31,12 @@ class AnswerSnapshotRepository:
             confidence_reason=confidence_reason
         )
         db.add(snapshot)
-        db.commit()
+        if commit:
+            db.commit()
         return snapshot
 
     @staticmethod
     def get_latest_by_session(db: Session, session_id):
-        session_id = str(session_id)
-        return (
-            db.query(AnswerSnapshot)
-            .filter(AnswerSnapshot.session_id == session_id)
-            .order_by(AnswerSnapshot.created_at.desc())
-            .first()
-        )
+        return db.execute(
+            _SEL_LATEST_SNAPSHOT, {"sid": str(session_id)}
+        ).scalars().first()
@@ -1,38 +1,87 @@
+import csv
+import io
+import json
 import uuid
+from sqlalchemy import bindparam, insert, select
 from sqlalchemy.orm import Session
 from storage.models.evidence import Evidence
 
 
+_SEL_BY_SESSION = select(Evidence).where(Evidence.session_id == bindparam("sid"))
+
+_SEL_ITEMS_BY_SESSION = select(
+    Evidence.claim_text,
+    Evidence.verification_status,
+    Evidence.source_urls,
+).where(Evidence.session_id == bindparam("sid"))
+
+# Above this many rows (deep verification runs) Postgres ingests via COPY,
+# which streams all rows in one command instead of a VALUES page per 500.
+COPY_THRESHOLD = 200
+
+_COPY_SQL = (
+    "COPY evidence (id, session_id, claim_text, verification_status, source_urls) "
+    "FROM STDIN WITH (FORMAT csv)"
+)
+
+
+def _copy_rows(db: Session, rows: list[dict]) -> None:
+    buf = io.StringIO()
+    # QUOTE_ALL: Postgres CSV reads an unquoted empty field as NULL.
+    writer = csv.writer(buf, quoting=csv.QUOTE_ALL)
+    for row in rows:
+        writer.writerow((
+            row["id"],
+            row["session_id"],
+            row["claim_text"],
+            row["verification_status"],
+            json.dumps(row["source_urls"]),
+        ))
+    buf.seek(0)
+    # The session's own connection, so the COPY joins its transaction.
+    raw = db.connection().connection
+    with raw.cursor() as cursor:
+        cursor.copy_expert(_COPY_SQL, buf)
+
+
 class EvidenceRepository:
 
     @staticmethod
     def bulk_create(
         db: Session,
         session_id,
-        evidence_items: list[dict]
+        evidence_items: list[dict],
+        commit: bool = True
     ):
         session_id = str(session_id)
-        records = []
-
-        for item in evidence_items:
-            records.append(
-                Evidence(
-                    id=str(uuid.uuid4()),
-                    session_id=session_id,
-                    claim_text=item["claim"],
-                    verification_status=item["status"],
-                    source_urls=item["sources"]
-                )
-            )
-
-        db.add_all(records)
-        db.commit()
+        rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "session_id": session_id,
+                "claim_text": item["claim"],
+                "verification_status": item["status"],
+                "source_urls": item["sources"],
+            }
+            for item in evidence_items
+        ]
+
+        # One executemany INSERT (multi-row VALUES on Postgres) instead of
+        # per-object ORM flushes; COPY for large batches on psycopg2.
+        if len(rows) > COPY_THRESHOLD and db.get_bind().dialect.driver == "psycopg2":
+            _copy_rows(db, rows)
+        elif rows:
+            db.execute(insert(Evidence), rows)
+        if commit:
+            db.commit()
 
     @staticmethod
     def list_by_session(db: Session, session_id):
-        session_id = str(session_id)
-        return (
-            db.query(Evidence)
-            .filter(Evidence.session_id == session_id)
-            .all()
-        )
+        return db.execute(_SEL_BY_SESSION, {"sid": str(session_id)}).scalars().all()
+
+    @staticmethod
+    def list_items_by_session(db: Session, session_id):
+        """
+        Column-only read of (claim_text, verification_status, source_urls)
+        tuples; skips ORM instance construction for read-only callers.
+        """
+        return db.execute(_SEL_ITEMS_BY_SESSION, {"sid": str(session_id)}).all()
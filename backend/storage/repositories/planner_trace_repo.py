@@ -1,8 +1,16 @@
 import uuid
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from storage.models.planner_trace import PlannerTrace
 
 
+_SEL_BY_SESSION = (
+    select(PlannerTrace)
+    .where(PlannerTrace.session_id == bindparam("sid"))
+    .order_by(PlannerTrace.attempt_number.asc())
+)
+
+
 class PlannerTraceRepository:
 
     @staticmethod
@@ -14,7 +22,8 @@ class PlannerTraceRepository:
         verification_decision: str,
         strategy_used: str,
         num_docs: int,
-        stop_reason: str | None = None
+        stop_reason: str | None = None,
+        commit: bool = True
     ):
         trace = PlannerTrace(
             id=str(uuid.uuid4()),
@@ -27,14 +36,9 @@ class PlannerTraceRepository:
             stop_reason=stop_reason
         )
         db.add(trace)
-        db.commit()
+        if commit:
+            db.commit()
 
     @staticmethod
     def list_by_session(db: Session, session_id):
-        session_id = str(session_id)
-        return (
-            db.query(PlannerTrace)
-            .filter(PlannerTrace.session_id == session_id)
-            .order_by(PlannerTrace.attempt_number.asc())
-            .all()
-        )
+        return db.execute(_SEL_BY_SESSION, {"sid": str(session_id)}).scalars().all()
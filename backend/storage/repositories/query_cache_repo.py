@@ -1,43 +1,110 @@
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 from storage.models.query_cache import QueryCache
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+
+# Postgres compares against its own clock, so the lookup never ships a
+# Python timestamp. query_hash is the primary key: the PK index finds at most
+# one row, and expires_at is checked on that row.
+_SEL_VALID = select(QueryCache).where(
+    QueryCache.query_hash == bindparam("h"),
+    QueryCache.expires_at > func.now(),
+)
+
+# SQLite's CURRENT_TIMESTAMP is second-resolution text, which would break the
+# strict expires_at > now rule; bind the current UTC time there instead.
+_SEL_VALID_BOUND = select(QueryCache).where(
+    QueryCache.query_hash == bindparam("h"),
+    QueryCache.expires_at > bindparam("now"),
+)
+
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE.
+_UPSERT_INSERTS = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
+
+
+def _dialect_name(db: Session) -> str:
+    try:
+        return db.get_bind().dialect.name
+    except Exception:
+        return ""
+
+
+def _is_postgres(db: Session) -> bool:
+    return _dialect_name(db) == "postgresql"
 
 
 class QueryCacheRepository:
 
     @staticmethod
-    def get_valid(db: Session, query_hash: str):
-        return db.query(QueryCache).filter(
-            QueryCache.query_hash == query_hash,
-            QueryCache.expires_at > datetime.utcnow()
-        ).first()
+    def get_valid(
+        db: Session,
+        query_hash: bytes,
+        clock: Optional[Callable[[], datetime]] = None
+    ):
+        # `clock` pins "now" (tests); without it Postgres uses its own clock.
+        postgres = _is_postgres(db)
+        if clock is None and postgres:
+            result = db.execute(_SEL_VALID, {"h": query_hash})
+        else:
+            now = clock() if clock is not None else datetime.utcnow()
+            if now.tzinfo is not None and not postgres:
+                # SQLite keeps DateTime values as offset-less UTC text
+                now = now.astimezone(timezone.utc).replace(tzinfo=None)
+            result = db.execute(_SEL_VALID_BOUND, {"h": query_hash, "now": now})
+        return result.scalars().first()
 
     @staticmethod
-    def store(db: Session, query_hash: str, session_id, ttl_seconds: int):
-        expires_at = datetime.utcnow() + timedelta(seconds=ttl_seconds)
-        cache = QueryCache(
+    def store(db: Session, query_hash: bytes, session_id, ttl_seconds: int, commit: bool = True):
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+        QueryCacheRepository.set(
+            db=db,
             query_hash=query_hash,
-            session_id=str(session_id),
-            expires_at=expires_at
+            session_id=session_id,
+            expires_at=expires_at,
+            commit=commit
         )
-        db.merge(cache)
-        db.commit()
 
     @staticmethod
-    def get(db: Session, query_hash: str):
+    def get(db: Session, query_hash: bytes):
         return QueryCacheRepository.get_valid(db=db, query_hash=query_hash)
 
     @staticmethod
     def set(
         db: Session,
-        query_hash: str,
+        query_hash: bytes,
         session_id,
-        expires_at
+        expires_at,
+        commit: bool = True
     ):
-        cache = QueryCache(
-            query_hash=query_hash,
-            session_id=str(session_id),
-            expires_at=expires_at
-        )
-        db.merge(cache)
-        db.commit()
+        insert = _UPSERT_INSERTS.get(_dialect_name(db))
+        if insert is not None:
+            # Single-statement upsert instead of merge()'s SELECT + INSERT/UPDATE.
+            stmt = insert(QueryCache).values(
+                query_hash=query_hash,
+                session_id=str(session_id),
+                expires_at=expires_at
+            )
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=[QueryCache.query_hash],
+                set_={
+                    "session_id": stmt.excluded.session_id,
+                    "expires_at": stmt.excluded.expires_at,
+                }
+            ))
+        else:
+            cache = QueryCache(
+                query_hash=query_hash,
+                session_id=str(session_id),
+                expires_at=expires_at
+            )
+            db.merge(cache)
+        if commit:
+            db.commit()
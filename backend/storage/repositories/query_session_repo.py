@@ -1,8 +1,54 @@
 import uuid
-from sqlalchemy.orm import Session
+from functools import lru_cache
+from sqlalchemy import Select, bindparam, select, update
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.util import identity_key
 from storage.models.query_session import QuerySession
 
 
+# Hot-path statements are built once; only the bound values change per call,
+# so each one hits the same compiled-statement cache entry.
+_SEL_STATUS = select(QuerySession.status).where(QuerySession.id == bindparam("sid"))
+
+
+@lru_cache(maxsize=None)
+def _sel_with_children(children: tuple) -> Select:
+    # Same as the _SEL_* statements, built once per distinct set of child
+    # collections (a handful at most) rather than once per call.
+    return select(QuerySession).where(QuerySession.id == bindparam("sid")).options(
+        *(selectinload(getattr(QuerySession, child)) for child in children)
+    )
+
+_UPD_STATUS = (
+    update(QuerySession)
+    .where(QuerySession.id == bindparam("sid"))
+    .values(status=bindparam("new_status"))
+    .execution_options(synchronize_session=False)
+)
+
+_UPD_FINAL_STATUS = (
+    update(QuerySession)
+    .where(QuerySession.id == bindparam("sid"))
+    .values(
+        status=bindparam("new_status"),
+        final_confidence_level=bindparam("new_level"),
+        final_confidence_reason=bindparam("new_reason"),
+    )
+    .execution_options(synchronize_session=False)
+)
+
+
+def _expire_loaded(db: Session, session_id: str, *attrs: str) -> None:
+    """
+    Expire updated attributes on an already-loaded session row. The UPDATEs
+    above bypass the identity map, so without this a later get() in the same
+    session would return the pre-update values.
+    """
+    instance = db.identity_map.get(identity_key(QuerySession, session_id))
+    if instance is not None:
+        db.expire(instance, list(attrs))
+
+
 class QuerySessionRepository:
 
     @staticmethod
@@ -23,29 +69,51 @@ class QuerySessionRepository:
         session_id,
         status: str,
         confidence_level: str,
-        confidence_reason: str
+        confidence_reason: str,
+        commit: bool = True
     ):
         session_id = str(session_id)
-        db.query(QuerySession).filter(
-            QuerySession.id == session_id
-        ).update({
-            "status": status,
-            "final_confidence_level": confidence_level,
-            "final_confidence_reason": confidence_reason
+        db.execute(_UPD_FINAL_STATUS, {
+            "sid": session_id,
+            "new_status": status,
+            "new_level": confidence_level,
+            "new_reason": confidence_reason,
         })
-        db.commit()
+        _expire_loaded(
+            db, session_id,
+            "status", "final_confidence_level", "final_confidence_reason",
+        )
+        if commit:
+            db.commit()
 
     @staticmethod
-    def update_status(db: Session, session_id, status: str) -> None:
+    def update_status(db: Session, session_id, status: str, commit: bool = True) -> None:
         session_id = str(session_id)
-        db.query(QuerySession).filter(
-            QuerySession.id == session_id
-        ).update({"status": status})
-        db.commit()
+        db.execute(_UPD_STATUS, {"sid": session_id, "new_status": status})
+        _expire_loaded(db, session_id, "status")
+        if commit:
+            db.commit()
 
     @staticmethod
     def get(db: Session, session_id) -> QuerySession | None:
-        session_id = str(session_id)
-        return db.query(QuerySession).filter(
-            QuerySession.id == session_id
-        ).first()
+        # Session.get answers from the identity map when the row is already
+        # loaded in this session (request-scoped memoization) and only emits
+        # a primary-key SELECT otherwise; the update methods expire what they
+        # change, so a hit never returns stale status.
+        return db.get(QuerySession, str(session_id))
+
+    @staticmethod
+    def get_status(db: Session, session_id) -> str | None:
+        """Status column only (None for an unknown session), for status polls."""
+        return db.execute(_SEL_STATUS, {"sid": str(session_id)}).scalar_one_or_none()
+
+    @staticmethod
+    def get_with_children(db: Session, session_id, *children) -> QuerySession | None:
+        """
+        Load a session together with the named child collections
+        ("snapshots", "evidence", "planner_traces", "search_logs"),
+        one IN-query per collection instead of a lazy load per access.
+        """
+        return db.execute(
+            _sel_with_children(children), {"sid": str(session_id)}
+        ).scalar_one_or_none()
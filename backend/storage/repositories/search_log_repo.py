@@ -1,8 +1,16 @@
 import uuid
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from storage.models.search_log import SearchLog
 
 
+_SEL_BY_SESSION = (
+    select(SearchLog)
+    .where(SearchLog.session_id == bindparam("sid"))
+    .order_by(SearchLog.attempt_number.asc())
+)
+
+
 class SearchLogRepository:
 
     @staticmethod
@@ -12,7 +20,8 @@ class SearchLogRepository:
         attempt_number: int,
         query_used: str,
         num_docs: int,
-        success: bool
+        success: bool,
+        commit: bool = True
     ):
         log = SearchLog(
             id=str(uuid.uuid4()),
@@ -23,14 +32,9 @@ class SearchLogRepository:
             success=success
         )
         db.add(log)
-        db.commit()
+        if commit:
+            db.commit()
 
     @staticmethod
     def list_by_session(db: Session, session_id):
-        session_id = str(session_id)
-        return (
-            db.query(SearchLog)
-            .filter(SearchLog.session_id == session_id)
-            .order_by(SearchLog.attempt_number.asc())
-            .all()
-        )
+        return db.execute(_SEL_BY_SESSION, {"sid": str(session_id)}).scalars().all()
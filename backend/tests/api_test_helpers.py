@@ -0,0 +1,261 @@
+"""
+Shared plumbing for the API contract tests (1.2 Poll Status, 1.3 Fetch Result):
+HTTP session, result collector, status polling, and the pre-warmed sessions
+that tests needing a finished run share.
+"""
+
+import asyncio
+import threading
+import time
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import List, Dict, Tuple, Optional
+
+try:
+    # orjson parses resp.content (bytes) directly, skipping the str decode
+    from orjson import loads as _json_loads  # type: ignore
+except Exception:
+    import json
+    _json_loads = json.loads
+
+BASE_URL = "http://127.0.0.1:8000"
+# Only the session id varies per call, so the URLs are prebuilt templates
+QUERY_URL = BASE_URL + "/api/query"
+STATUS_TPL = BASE_URL + "/api/query/%s/status"
+
+# One keep-alive pool for every call (including the 20-thread concurrency
+# tests) instead of a new TCP connection per request.
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0))
+
+TERMINAL_STATES = {"DONE", "FAILED"}
+
+# Poll backoff: start tight, grow 1.5x per unchanged poll up to 1s, and
+# drop back to the minimum whenever the status moves.
+POLL_DELAY_MIN = 0.05
+POLL_DELAY_MAX = 1.0
+POLL_BACKOFF = 1.5
+
+# Test results collector (tests run concurrently, see each script's main())
+results: List[Dict] = []
+_results_lock = threading.Lock()
+
+
+def record(test_name: str, passed: bool, details: str = "", response_ms: float = 0):
+    status = "✅ PASS" if passed else "❌ FAIL"
+    with _results_lock:
+        results.append({
+            "test": test_name,
+            "passed": passed,
+            "details": details,
+            "response_ms": response_ms
+        })
+        print(f"{status} | {test_name} | {response_ms:.1f}ms | {details}")
+
+
+def _stats(xs) -> Tuple[float, float, float]:
+    """(mean, min, max) of non-empty latency samples in a single pass."""
+    it = iter(xs)
+    total = lo = hi = next(it)
+    n = 1
+    for x in it:
+        total += x
+        if x < lo:
+            lo = x
+        elif x > hi:
+            hi = x
+        n += 1
+    return total / n, lo, hi
+
+
+def submit_query(question: str) -> Tuple[Optional[str], int]:
+    """Submit a query and return (session_id, status_code)"""
+    try:
+        resp = SESSION.post(
+            QUERY_URL,
+            json={"question": question},
+            timeout=10
+        )
+        if resp.status_code == 200:
+            return resp.json().get("session_id"), resp.status_code
+        return None, resp.status_code
+    except Exception as e:
+        return None, 0
+
+
+def poll_status(session_id: str) -> Tuple[Dict, float, int]:
+    """Poll status and return (response_json, response_time_ms, status_code)"""
+    start = time.perf_counter()
+    try:
+        resp = SESSION.get(
+            STATUS_TPL % session_id,
+            timeout=10
+        )
+        # Full request including the body, the same measure as the async helper
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        try:
+            data = _json_loads(resp.content)
+        except:
+            data = {"raw": resp.text}
+        return data, elapsed_ms, resp.status_code
+    except Exception as e:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        return {"error": str(e)}, elapsed_ms, 0
+
+
+async def _apoll(client: httpx.AsyncClient, session_id: str) -> Tuple[Dict, float, int]:
+    """poll_status() over a shared AsyncClient, same return shape."""
+    start = time.perf_counter()
+    try:
+        resp = await client.get(
+            STATUS_TPL % session_id,
+            timeout=10
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        try:
+            data = _json_loads(resp.content)
+        except:
+            data = {"raw": resp.text}
+        return data, elapsed_ms, resp.status_code
+    except Exception as e:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        return {"error": str(e)}, elapsed_ms, 0
+
+
+def poll_until_terminal(session_id: str, max_wait_sec: float = 60) -> List[str]:
+    """
+    Poll until terminal state, return list of observed statuses.
+    """
+    observed = []
+    start = time.time()
+    last_status = None
+    delay = POLL_DELAY_MIN
+
+    while time.time() - start < max_wait_sec:
+        data, ms, code = poll_status(session_id)
+        if code != 200:
+            observed.append(f"ERROR_{code}")
+            break
+
+        status = data.get("status", "UNKNOWN")
+
+        # Only record if status changed
+        if status != last_status:
+            observed.append(status)
+            last_status = status
+            delay = POLL_DELAY_MIN
+
+        if status in TERMINAL_STATES:
+            break
+
+        time.sleep(delay)
+        delay = min(delay * POLL_BACKOFF, POLL_DELAY_MAX)
+
+    return observed
+
+
+async def _await_terminal(client: httpx.AsyncClient, session_id: str, max_wait_sec: float = 60) -> List[str]:
+    """poll_until_terminal() as a coroutine, so one event loop can wait on many sessions."""
+    observed = []
+    deadline = time.monotonic() + max_wait_sec
+    last_status = None
+    delay = POLL_DELAY_MIN
+
+    while time.monotonic() < deadline:
+        data, ms, code = await _apoll(client, session_id)
+        if code != 200:
+            observed.append(f"ERROR_{code}")
+            break
+
+        status = data.get("status", "UNKNOWN")
+        if status != last_status:
+            observed.append(status)
+            last_status = status
+            delay = POLL_DELAY_MIN
+
+        if status in TERMINAL_STATES:
+            break
+
+        await asyncio.sleep(delay)
+        delay = min(delay * POLL_BACKOFF, POLL_DELAY_MAX)
+
+    return observed
+
+
+# Tests that only need *a* finished session share one run of this question.
+COMPLETED_QUESTION = "What is machine learning?"
+
+# Submitted together by warmup() so the server works on them in parallel
+# while the tests start; question -> session_id.
+PREWARMED: Dict[str, str] = {}
+# question -> future list of observed states. All of these waits run on one
+# event loop thread instead of each parking a test thread in time.sleep().
+PREWARM_WAITS: Dict[str, "Future[List[str]]"] = {}
+
+
+def warmup(
+    questions: Tuple[str, ...],
+    max_wait_sec: float = 90,
+) -> Tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]:
+    """
+    Submit every shared question in one burst, before any test waits on it.
+    Returns the (client, loop) the waits run on; the caller closes the client
+    on that loop and stops it once the tests are done.
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        submitted = executor.map(submit_query, questions)
+        for question, (session_id, code) in zip(questions, submitted):
+            if session_id:
+                PREWARMED[question] = session_id
+
+    client = httpx.AsyncClient()
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="session-waits", daemon=True).start()
+    for question, session_id in PREWARMED.items():
+        PREWARM_WAITS[question] = asyncio.run_coroutine_threadsafe(
+            _await_terminal(client, session_id, max_wait_sec), loop
+        )
+    return client, loop
+
+
+# One lock per question so concurrent tests wait for a single shared run
+# instead of each missing the cache and submitting their own.
+_session_locks: Dict[str, threading.Lock] = {}
+# question -> (session_id, final_status), filled only once a run reaches a
+# terminal state; a timeout or failed submit is retried by the next caller.
+_completed: Dict[str, Tuple[str, str]] = {}
+
+
+def get_completed_session(question: str, max_wait_sec: float = 90) -> Tuple[Optional[str], str]:
+    """
+    Submit `question` once per run and poll it to a terminal state.
+    Returns (session_id, final_status); repeat calls reuse that session
+    instead of paying for another full planner run.
+    """
+    with _session_locks.setdefault(question, threading.Lock()):
+        cached = _completed.get(question)
+        if cached is not None:
+            return cached
+        session_id, final_status = _run_to_terminal(question, max_wait_sec)
+        if final_status in TERMINAL_STATES:
+            _completed[question] = (session_id, final_status)
+        return session_id, final_status
+
+
+def _run_to_terminal(question: str, max_wait_sec: float) -> Tuple[Optional[str], str]:
+    # A pre-warmed run is consumed here, so if it did not finish the next
+    # attempt submits afresh rather than re-reading the same outcome.
+    session_id = PREWARMED.pop(question, None)
+    if session_id is not None:
+        try:
+            states = PREWARM_WAITS.pop(question).result(timeout=max_wait_sec)
+        except FutureTimeoutError:
+            return session_id, "TIMEOUT"
+        return session_id, states[-1] if states else "UNKNOWN"
+    session_id, code = submit_query(question)
+    if code != 200 or not session_id:
+        return None, f"SUBMIT_{code}"
+    states = poll_until_terminal(session_id, max_wait_sec=max_wait_sec)
+    return session_id, states[-1] if states else "UNKNOWN"
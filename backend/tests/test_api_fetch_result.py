@@ -3,71 +3,65 @@ API Contract & Behavior Tests - Fetch Result API (1.3)
 Tests surface correctness of GET /api/query/{session_id}/result endpoint
 """
 
+import asyncio
 import time
 import uuid
-import requests
-from typing import List, Dict, Tuple, Optional
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
 import sys
 
-BASE_URL = "http://127.0.0.1:8000"
+from api_test_helpers import (
+    BASE_URL,
+    COMPLETED_QUESTION,
+    SESSION,
+    TERMINAL_STATES,
+    _json_loads,
+    _stats,
+    get_completed_session,
+    record,
+    results,
+    submit_query,
+    warmup,
+)
 
-TERMINAL_STATES = {"DONE", "FAILED"}
+RESULT_TPL = BASE_URL + "/api/query/%s/result"
 
-# Test results collector
-results: List[Dict] = []
+# Question the FAILED-path test waits on (may well end DONE).
+FAILURE_QUESTION = "Test query for failure handling"
 
 
-def record(test_name: str, passed: bool, details: str = "", response_ms: float = 0):
-    status = "✅ PASS" if passed else "❌ FAIL"
-    results.append({
-        "test": test_name,
-        "passed": passed,
-        "details": details,
-        "response_ms": response_ms
-    })
-    print(f"{status} | {test_name} | {response_ms:.1f}ms | {details}")
-
-
-def submit_query(question: str) -> Tuple[Optional[str], int]:
-    """Submit a query and return (session_id, status_code)"""
-    try:
-        resp = requests.post(
-            f"{BASE_URL}/api/query",
-            json={"question": question},
-            timeout=10
-        )
-        if resp.status_code == 200:
-            return resp.json().get("session_id"), resp.status_code
-        return None, resp.status_code
-    except Exception as e:
-        return None, 0
-
-
-def poll_status(session_id: str) -> Tuple[str, int]:
-    """Poll status and return (status, status_code)"""
+def fetch_result(session_id: str) -> Tuple[Dict, float, int]:
+    """Fetch result and return (response_json, response_time_ms, status_code)"""
+    start = time.perf_counter()
     try:
-        resp = requests.get(
-            f"{BASE_URL}/api/query/{session_id}/status",
-            timeout=10
+        resp = SESSION.get(
+            RESULT_TPL % session_id,
+            timeout=30
         )
-        if resp.status_code == 200:
-            return resp.json().get("status", "UNKNOWN"), resp.status_code
-        return "ERROR", resp.status_code
+        # Full request including the body, the same measure as the async helper
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        try:
+            data = _json_loads(resp.content)
+        except:
+            data = {"raw": resp.text}
+        return data, elapsed_ms, resp.status_code
     except Exception as e:
-        return "ERROR", 0
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        return {"error": str(e)}, elapsed_ms, 0
 
 
-def fetch_result(session_id: str) -> Tuple[Dict, float, int]:
-    """Fetch result and return (response_json, response_time_ms, status_code)"""
+async def _afetch(client: httpx.AsyncClient, session_id: str) -> Tuple[Dict, float, int]:
+    """fetch_result() over a shared AsyncClient, same return shape."""
     start = time.perf_counter()
     try:
-        resp = requests.get(
-            f"{BASE_URL}/api/query/{session_id}/result",
+        resp = await client.get(
+            RESULT_TPL % session_id,
             timeout=30
         )
         elapsed_ms = (time.perf_counter() - start) * 1000
         try:
-            data = resp.json()
+            data = _json_loads(resp.content)
         except:
             data = {"raw": resp.text}
         return data, elapsed_ms, resp.status_code
@@ -76,17 +70,6 @@ def fetch_result(session_id: str) -> Tuple[Dict, float, int]:
         return {"error": str(e)}, elapsed_ms, 0
 
 
-def wait_for_terminal(session_id: str, max_wait_sec: float = 120) -> str:
-    """Wait until session reaches terminal state, return final status"""
-    start = time.time()
-    while time.time() - start < max_wait_sec:
-        status, code = poll_status(session_id)
-        if status in TERMINAL_STATES:
-            return status
-        time.sleep(0.5)
-    return "TIMEOUT"
-
-
 # ============================================================
 # TEST 1.3.1: Call Before DONE (expect 409)
 # ============================================================
@@ -133,15 +116,12 @@ def test_fetch_before_done():
 # ============================================================
 def test_fetch_after_done():
     """Fetching result after DONE should return complete answer with evidence"""
-    session_id, code = submit_query("What is 2 + 2?")
+    session_id, final_status = get_completed_session(COMPLETED_QUESTION)
     
-    if code != 200 or not session_id:
+    if not session_id:
         record("1.3.2 Fetch After DONE", False, "Submit failed")
         return
     
-    # Wait for completion
-    final_status = wait_for_terminal(session_id, max_wait_sec=60)
-    
     if final_status != "DONE":
         record("1.3.2 Fetch After DONE", False, f"Did not reach DONE: {final_status}")
         return
@@ -214,15 +194,12 @@ def test_fetch_after_failed():
     Note: Hard to force failure without mocking - test handles both outcomes.
     """
     # Use a query that might fail or succeed
-    session_id, code = submit_query("Test query for failure handling")
+    session_id, final_status = get_completed_session(FAILURE_QUESTION, 60)
     
-    if code != 200 or not session_id:
+    if not session_id:
         record("1.3.3 Fetch After FAILED", False, "Submit failed")
         return
     
-    # Wait for completion
-    final_status = wait_for_terminal(session_id, max_wait_sec=60)
-    
     if final_status == "FAILED":
         # Good - we got a FAILED status, test the response
         data, ms, status_code = fetch_result(session_id)
@@ -265,63 +242,62 @@ def test_fetch_after_failed():
 # ============================================================
 def test_idempotent_fetch():
     """Multiple fetches should return identical results"""
-    session_id, code = submit_query("What color is the sky?")
+    session_id, final_status = get_completed_session(COMPLETED_QUESTION)
     
-    if code != 200 or not session_id:
+    if not session_id:
         record("1.3.4 Idempotent Fetch", False, "Submit failed")
         return
     
-    # Wait for completion
-    final_status = wait_for_terminal(session_id, max_wait_sec=60)
-    
     if final_status not in TERMINAL_STATES:
         record("1.3.4 Idempotent Fetch", False, f"Did not complete: {final_status}")
         return
     
-    # Fetch multiple times
-    results_list = []
+    # Fetch multiple times. Each call is a real round trip on purpose: a
+    # client-side response cache would make this compare a copy with itself.
     times_list = []
+    answers, confidences, ev_counts = [], [], []
     
-    for i in range(5):
-        data, ms, status_code = fetch_result(session_id)
+    # Overlapping fetches stress consistency harder than spaced serial ones
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        fetched = list(executor.map(fetch_result, [session_id] * 5))
+    
+    # One pass pulls out every field the checks below compare
+    for data, ms, status_code in fetched:
         if status_code == 200:
-            results_list.append(data)
             times_list.append(ms)
-        time.sleep(0.2)
+            answers.append(data.get("answer", ""))
+            confidences.append(data.get("confidence_level", ""))
+            ev_counts.append(len(data.get("evidence") or ()))
     
-    if len(results_list) < 5:
-        record("1.3.4 Idempotent Fetch", False, f"Only {len(results_list)}/5 successful")
+    if len(times_list) < 5:
+        record("1.3.4 Idempotent Fetch", False, f"Only {len(times_list)}/5 successful")
         return
     
     checks = []
     
     # Check 1: All answers are identical
-    answers = [r.get("answer", "") for r in results_list]
-    answers_identical = len(set(answers)) == 1
+    answers_identical = all(x == answers[0] for x in answers)
     if answers_identical:
         checks.append("answers_identical")
     else:
         checks.append("answers_differ!")
     
     # Check 2: All confidence levels identical
-    confidences = [r.get("confidence_level", "") for r in results_list]
-    conf_identical = len(set(confidences)) == 1
+    conf_identical = all(x == confidences[0] for x in confidences)
     if conf_identical:
         checks.append("confidence_identical")
     else:
         checks.append("confidence_differs!")
     
     # Check 3: All evidence counts identical
-    ev_counts = [len(r.get("evidence", [])) for r in results_list]
-    ev_identical = len(set(ev_counts)) == 1
+    ev_identical = all(x == ev_counts[0] for x in ev_counts)
     if ev_identical:
         checks.append(f"evidence_identical({ev_counts[0]})")
     else:
         checks.append(f"evidence_differs={ev_counts}")
     
     # Check 4: Response times are fast (no recomputation)
-    avg_time = sum(times_list) / len(times_list)
-    max_time = max(times_list)
+    avg_time, _, max_time = _stats(times_list)
     if avg_time < 100 and max_time < 200:
         checks.append(f"fast(avg={avg_time:.0f}ms)")
     else:
@@ -336,15 +312,12 @@ def test_idempotent_fetch():
 # ============================================================
 def test_no_llm_on_fetch():
     """Fetch should be fast DB read, not trigger new LLM calls"""
-    session_id, code = submit_query("Explain photosynthesis briefly")
+    session_id, final_status = get_completed_session(COMPLETED_QUESTION)
     
-    if code != 200 or not session_id:
+    if not session_id:
         record("1.3.5 No LLM on Fetch", False, "Submit failed")
         return
     
-    # Wait for completion
-    final_status = wait_for_terminal(session_id, max_wait_sec=90)
-    
     if final_status not in TERMINAL_STATES:
         record("1.3.5 No LLM on Fetch", False, f"Did not complete: {final_status}")
         return
@@ -361,9 +334,7 @@ def test_no_llm_on_fetch():
         record("1.3.5 No LLM on Fetch", False, "No successful fetches")
         return
     
-    avg_ms = sum(fetch_times) / len(fetch_times)
-    max_ms = max(fetch_times)
-    min_ms = min(fetch_times)
+    avg_ms, min_ms, max_ms = _stats(fetch_times)
     
     # LLM calls typically take 500ms-5000ms
     # DB reads should be <100ms typically
@@ -383,6 +354,9 @@ def test_no_llm_on_fetch():
 # ============================================================
 # TEST 1.3.6: Invalid Session ID
 # ============================================================
+# 1.3.6/1.3.7 are deliberately not memoized: each id is requested once per
+# run (1.3.6 uses a fresh uuid4), so a per-process cache would never hit,
+# and a cross-run cache would stop verifying the server's 404 handling.
 def test_invalid_session_id():
     """Should return 404 for non-existent session"""
     fake_id = str(uuid.uuid4())
@@ -431,15 +405,12 @@ def test_malformed_session_id():
 # ============================================================
 def test_result_structure():
     """Verify result has all expected fields with correct types"""
-    session_id, code = submit_query("What is machine learning?")
+    session_id, final_status = get_completed_session(COMPLETED_QUESTION)
     
-    if code != 200 or not session_id:
+    if not session_id:
         record("1.3.8 Result Structure", False, "Submit failed")
         return
     
-    # Wait for completion
-    final_status = wait_for_terminal(session_id, max_wait_sec=90)
-    
     if final_status != "DONE":
         record("1.3.8 Result Structure", final_status == "FAILED", f"Status={final_status}")
         return
@@ -491,34 +462,31 @@ def test_result_structure():
 # ============================================================
 def test_concurrent_fetches():
     """Multiple concurrent fetches should all succeed"""
-    import concurrent.futures
-    
-    session_id, code = submit_query("What is artificial intelligence?")
+    session_id, final_status = get_completed_session(COMPLETED_QUESTION)
     
-    if code != 200 or not session_id:
+    if not session_id:
         record("1.3.9 Concurrent Fetches", False, "Submit failed")
         return
     
-    # Wait for completion
-    final_status = wait_for_terminal(session_id, max_wait_sec=90)
-    
     if final_status not in TERMINAL_STATES:
         record("1.3.9 Concurrent Fetches", False, f"Did not complete: {final_status}")
         return
     
-    # Fire 20 concurrent fetches
-    def do_fetch():
-        return fetch_result(session_id)
-    
-    with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-        futures = [executor.submit(do_fetch) for _ in range(20)]
-        results_local = [f.result() for f in concurrent.futures.as_completed(futures)]
-    
-    success_count = sum(1 for data, ms, code in results_local if code == 200)
-    error_count = sum(1 for data, ms, code in results_local if code >= 500)
-    
-    # All successful results should have same answer
-    answers = [data.get("answer", "")[:100] for data, ms, code in results_local if code == 200]
+    # Fire 20 concurrent fetches from one event loop
+    async def fire():
+        async with httpx.AsyncClient(limits=httpx.Limits(max_connections=32)) as client:
+            return await asyncio.gather(*(_afetch(client, session_id) for _ in range(20)))
+    
+    results_local = asyncio.run(fire())
+    
+    error_count = 0
+    answers = []  # successful results should all carry the same answer
+    for data, ms, code in results_local:
+        if code == 200:
+            answers.append(data.get("answer", "")[:100])
+        elif code >= 500:
+            error_count += 1
+    success_count = len(answers)
     unique_answers = len(set(answers))
     
     passed = success_count == 20 and error_count == 0 and unique_answers == 1
@@ -538,7 +506,7 @@ def main():
     
     # Check server is up
     try:
-        resp = requests.get(f"{BASE_URL}/openapi.json", timeout=5)
+        resp = SESSION.get(f"{BASE_URL}/openapi.json", timeout=5)
         if resp.status_code != 200:
             print("❌ Server not responding. Start with: uvicorn backend.main:app")
             sys.exit(1)
@@ -547,36 +515,54 @@ def main():
         print(f"❌ Cannot connect to server: {e}")
         sys.exit(1)
     
+    client, loop = warmup((COMPLETED_QUESTION, FAILURE_QUESTION))
+    
     print()
     print("-" * 70)
     
-    # Run all tests
-    test_fetch_before_done()
-    test_fetch_after_done()
-    test_fetch_after_failed()
-    test_idempotent_fetch()
-    test_no_llm_on_fetch()
-    test_invalid_session_id()
-    test_malformed_session_id()
-    test_result_structure()
-    test_concurrent_fetches()
+    # Run the independent tests concurrently; they mostly wait on the
+    # server, so wall time is the slowest test rather than the sum.
+    tests = [
+        test_fetch_after_done,
+        test_fetch_after_failed,
+        test_invalid_session_id,
+        test_malformed_session_id,
+        test_result_structure,
+        test_concurrent_fetches,
+    ]
+    # Tests asserting absolute latencies run one at a time after that
+    # batch, so the bursts and planner runs above do not skew them.
+    timed_tests = [
+        test_fetch_before_done,
+        test_idempotent_fetch,
+        test_no_llm_on_fetch,
+    ]
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda test: test(), tests))
+        for test in timed_tests:
+            test()
+    finally:
+        # Close the pre-warm client on its own loop, then stop that loop
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
     
     print("-" * 70)
     print()
     
     # Summary
-    passed = sum(1 for r in results if r["passed"])
-    failed = sum(1 for r in results if not r["passed"])
+    failures = [r for r in results if not r["passed"]]  # one scan feeds both
+    failed = len(failures)
+    passed = len(results) - failed
     
     print("=" * 70)
     print(f"SUMMARY: {passed} passed, {failed} failed out of {len(results)} tests")
     print("=" * 70)
     
-    if failed > 0:
+    if failures:
         print("\nFailed tests:")
-        for r in results:
-            if not r["passed"]:
-                print(f"  ❌ {r['test']}: {r['details']}")
+        for r in failures:
+            print(f"  ❌ {r['test']}: {r['details']}")
     
     print()
     return 0 if failed == 0 else 1
@@ -3,13 +3,30 @@ API Contract & Behavior Tests - Poll Status API (1.2)
 Tests surface correctness of GET /api/query/{session_id}/status endpoint
 """
 
+import asyncio
 import time
 import uuid
-import requests
-from typing import List, Dict, Tuple, Optional
+import httpx
+from concurrent.futures import ThreadPoolExecutor
 import sys
 
-BASE_URL = "http://127.0.0.1:8000"
+from api_test_helpers import (
+    BASE_URL,
+    COMPLETED_QUESTION,
+    SESSION,
+    TERMINAL_STATES,
+    POLL_BACKOFF,
+    POLL_DELAY_MAX,
+    POLL_DELAY_MIN,
+    _apoll,
+    _stats,
+    get_completed_session,
+    poll_status,
+    record,
+    results,
+    submit_query,
+    warmup,
+)
 
 # Valid state transitions (from -> to)
 # Note: Due to polling frequency, we may "skip" intermediate states
@@ -24,84 +41,8 @@ VALID_TRANSITIONS = {
     "PROCESSING": {"INIT", "RESEARCH", "VERIFY", "SYNTHESIZE", "DONE", "FAILED"},  # Initial API status
 }
 
-TERMINAL_STATES = {"DONE", "FAILED"}
-
-# Test results collector
-results: List[Dict] = []
-
-
-def record(test_name: str, passed: bool, details: str = "", response_ms: float = 0):
-    status = "✅ PASS" if passed else "❌ FAIL"
-    results.append({
-        "test": test_name,
-        "passed": passed,
-        "details": details,
-        "response_ms": response_ms
-    })
-    print(f"{status} | {test_name} | {response_ms:.1f}ms | {details}")
-
-
-def submit_query(question: str) -> Tuple[Optional[str], int]:
-    """Submit a query and return (session_id, status_code)"""
-    try:
-        resp = requests.post(
-            f"{BASE_URL}/api/query",
-            json={"question": question},
-            timeout=10
-        )
-        if resp.status_code == 200:
-            return resp.json().get("session_id"), resp.status_code
-        return None, resp.status_code
-    except Exception as e:
-        return None, 0
-
-
-def poll_status(session_id: str) -> Tuple[Dict, float, int]:
-    """Poll status and return (response_json, response_time_ms, status_code)"""
-    start = time.perf_counter()
-    try:
-        resp = requests.get(
-            f"{BASE_URL}/api/query/{session_id}/status",
-            timeout=10
-        )
-        elapsed_ms = (time.perf_counter() - start) * 1000
-        try:
-            data = resp.json()
-        except:
-            data = {"raw": resp.text}
-        return data, elapsed_ms, resp.status_code
-    except Exception as e:
-        elapsed_ms = (time.perf_counter() - start) * 1000
-        return {"error": str(e)}, elapsed_ms, 0
-
-
-def poll_until_terminal(session_id: str, max_wait_sec: float = 60) -> List[str]:
-    """
-    Poll until terminal state, return list of observed statuses.
-    """
-    observed = []
-    start = time.time()
-    last_status = None
-    
-    while time.time() - start < max_wait_sec:
-        data, ms, code = poll_status(session_id)
-        if code != 200:
-            observed.append(f"ERROR_{code}")
-            break
-        
-        status = data.get("status", "UNKNOWN")
-        
-        # Only record if status changed
-        if status != last_status:
-            observed.append(status)
-            last_status = status
-        
-        if status in TERMINAL_STATES:
-            break
-        
-        time.sleep(0.3)
-    
-    return observed
+# Question the FAILED-path test waits on (may well end DONE).
+FAILURE_QUESTION = "Test question that might fail"
 
 
 # ============================================================
@@ -166,6 +107,8 @@ def test_observe_research_state():
     research_seen = False
     poll_count = 0
     max_polls = 50
+    last_status = None
+    delay = POLL_DELAY_MIN
     
     while poll_count < max_polls:
         data, ms, status_code = poll_status(session_id)
@@ -182,7 +125,11 @@ def test_observe_research_state():
         if status in TERMINAL_STATES:
             break
         
-        time.sleep(0.1)
+        if status != last_status:
+            last_status = status
+            delay = POLL_DELAY_MIN
+        time.sleep(delay)
+        delay = min(delay * POLL_BACKOFF, POLL_DELAY_MAX)
     
     passed = research_seen
     details = f"research_seen={research_seen}, polls={poll_count}"
@@ -207,6 +154,7 @@ def test_observe_verify_state():
     poll_count = 0
     max_polls = 100
     last_status = None
+    delay = POLL_DELAY_MIN
     
     while poll_count < max_polls:
         data, ms, status_code = poll_status(session_id)
@@ -220,6 +168,7 @@ def test_observe_verify_state():
         if status != last_status:
             all_states.append(status)
             last_status = status
+            delay = POLL_DELAY_MIN
         
         if status == "VERIFY":
             verify_seen = True
@@ -227,7 +176,8 @@ def test_observe_verify_state():
         if status in TERMINAL_STATES:
             break
         
-        time.sleep(0.1)
+        time.sleep(delay)
+        delay = min(delay * POLL_BACKOFF, POLL_DELAY_MAX)
     
     # VERIFY may be quick - check if we at least saw proper progression
     proper_progression = len(all_states) >= 2
@@ -243,30 +193,26 @@ def test_observe_verify_state():
 # ============================================================
 def test_poll_after_done():
     """Status should remain DONE after completion"""
-    session_id, code = submit_query("What is 2+2?")
+    session_id, final_state = get_completed_session(COMPLETED_QUESTION)
     
-    if code != 200 or not session_id:
+    if not session_id:
         record("1.2.4 Poll After DONE", False, "Submit failed")
         return
     
-    # Wait for completion
-    states = poll_until_terminal(session_id, max_wait_sec=60)
-    
-    if "DONE" not in states and "FAILED" not in states:
-        record("1.2.4 Poll After DONE", False, f"Never reached terminal: {states}")
+    if final_state not in TERMINAL_STATES:
+        record("1.2.4 Poll After DONE", False, f"Never reached terminal: {final_state}")
         return
     
-    final_state = states[-1] if states else "UNKNOWN"
-    
     # Poll multiple times after terminal
     consistent = True
     post_terminal_states = []
     
-    for _ in range(5):
-        data, ms, status_code = poll_status(session_id)
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        polled = list(executor.map(poll_status, [session_id] * 5))
+    
+    for data, ms, status_code in polled:
         if status_code == 200:
             post_terminal_states.append(data.get("status"))
-        time.sleep(0.2)
     
     # All post-terminal polls should return same state
     if post_terminal_states:
@@ -286,26 +232,21 @@ def test_poll_after_failed():
     Status should remain FAILED after failure.
     Note: Hard to force failure without mocking, so we verify FAILED is stable if seen.
     """
-    # Submit a question and track if we see FAILED
-    session_id, code = submit_query("Test question that might fail")
+    # Wait on the shared failure-probing session and check FAILED if seen
+    session_id, final_state = get_completed_session(FAILURE_QUESTION, 60)
     
-    if code != 200 or not session_id:
+    if not session_id:
         record("1.2.5 Poll After FAILED", False, "Submit failed")
         return
     
-    # Wait for terminal
-    states = poll_until_terminal(session_id, max_wait_sec=60)
-    final_state = states[-1] if states else "UNKNOWN"
-    
     if final_state == "FAILED":
         # Verify FAILED is stable
-        stable = True
-        for _ in range(3):
-            data, ms, status_code = poll_status(session_id)
-            if status_code != 200 or data.get("status") != "FAILED":
-                stable = False
-                break
-            time.sleep(0.2)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            polled = list(executor.map(poll_status, [session_id] * 3))
+        stable = all(
+            status_code == 200 and data.get("status") == "FAILED"
+            for data, ms, status_code in polled
+        )
         
         passed = stable
         details = f"FAILED state is stable={stable}"
@@ -389,6 +330,7 @@ def test_no_status_regression():
     invalid_transitions = []
     poll_count = 0
     max_polls = 200
+    delay = POLL_DELAY_MIN
     
     while poll_count < max_polls:
         data, ms, status_code = poll_status(session_id)
@@ -407,6 +349,7 @@ def test_no_status_regression():
                 invalid_transitions.append(f"{last_status}->{current_status}")
             
             observed_states.append(current_status)
+            delay = POLL_DELAY_MIN
         elif last_status is None:
             observed_states.append(current_status)
         
@@ -415,7 +358,8 @@ def test_no_status_regression():
         if current_status in TERMINAL_STATES:
             break
         
-        time.sleep(0.15)
+        time.sleep(delay)
+        delay = min(delay * POLL_BACKOFF, POLL_DELAY_MAX)
     
     passed = len(invalid_transitions) == 0
     details = f"states={observed_states}, invalid={invalid_transitions}"
@@ -428,24 +372,18 @@ def test_no_status_regression():
 # ============================================================
 def test_concurrent_polling():
     """Multiple concurrent polls should all succeed"""
-    import concurrent.futures
-    
-    session_id, code = submit_query("What is machine learning?")
+    session_id, _ = get_completed_session(COMPLETED_QUESTION)
     
-    if code != 200 or not session_id:
+    if not session_id:
         record("1.2.9 Concurrent Polling", False, "Submit failed")
         return
     
-    # Wait a moment for planner to start
-    time.sleep(0.5)
-    
-    # Fire 20 concurrent polls
-    def do_poll():
-        return poll_status(session_id)
+    # Fire 20 concurrent polls from one event loop
+    async def fire():
+        async with httpx.AsyncClient(limits=httpx.Limits(max_connections=32)) as client:
+            return await asyncio.gather(*(_apoll(client, session_id) for _ in range(20)))
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-        futures = [executor.submit(do_poll) for _ in range(20)]
-        results_local = [f.result() for f in concurrent.futures.as_completed(futures)]
+    results_local = asyncio.run(fire())
     
     success_count = sum(1 for data, ms, code in results_local if code == 200)
     error_count = sum(1 for data, ms, code in results_local if code >= 500)
@@ -484,8 +422,7 @@ def test_poll_response_time():
         record("1.2.10 Poll Response Time", False, "No successful polls")
         return
     
-    avg_ms = sum(poll_times) / len(poll_times)
-    max_ms = max(poll_times)
+    avg_ms, _, max_ms = _stats(poll_times)
     
     # Polls should be fast (< 100ms average, < 500ms max)
     passed = avg_ms < 100 and max_ms < 500
@@ -505,7 +442,7 @@ def main():
     
     # Check server is up
     try:
-        resp = requests.get(f"{BASE_URL}/openapi.json", timeout=5)
+        resp = SESSION.get(f"{BASE_URL}/openapi.json", timeout=5)
         if resp.status_code != 200:
             print("❌ Server not responding. Start with: uvicorn backend.main:app")
             sys.exit(1)
@@ -514,37 +451,55 @@ def main():
         print(f"❌ Cannot connect to server: {e}")
         sys.exit(1)
     
+    client, loop = warmup((COMPLETED_QUESTION, FAILURE_QUESTION))
+    
     print()
     print("-" * 70)
     
-    # Run all tests
-    test_poll_immediately_after_submit()
-    test_observe_research_state()
-    test_observe_verify_state()
-    test_poll_after_done()
-    test_poll_after_failed()
-    test_invalid_session_id()
-    test_malformed_session_id()
-    test_no_status_regression()
-    test_concurrent_polling()
-    test_poll_response_time()
+    # Run the independent tests concurrently; they mostly wait on the
+    # server, so wall time is the slowest test rather than the sum.
+    tests = [
+        test_observe_research_state,
+        test_observe_verify_state,
+        test_poll_after_done,
+        test_poll_after_failed,
+        test_invalid_session_id,
+        test_malformed_session_id,
+        test_no_status_regression,
+        test_concurrent_polling,
+    ]
+    # Tests asserting absolute latencies run one at a time after that
+    # batch, so the bursts and planner runs above do not skew them.
+    timed_tests = [
+        test_poll_immediately_after_submit,
+        test_poll_response_time,
+    ]
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda test: test(), tests))
+        for test in timed_tests:
+            test()
+    finally:
+        # Close the pre-warm client on its own loop, then stop that loop
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
     
     print("-" * 70)
     print()
     
     # Summary
-    passed = sum(1 for r in results if r["passed"])
-    failed = sum(1 for r in results if not r["passed"])
+    failures = [r for r in results if not r["passed"]]  # one scan feeds both
+    failed = len(failures)
+    passed = len(results) - failed
     
     print("=" * 70)
     print(f"SUMMARY: {passed} passed, {failed} failed out of {len(results)} tests")
     print("=" * 70)
     
-    if failed > 0:
+    if failures:
         print("\nFailed tests:")
-        for r in results:
-            if not r["passed"]:
-                print(f"  ❌ {r['test']}: {r['details']}")
+        for r in failures:
+            print(f"  ❌ {r['test']}: {r['details']}")
     
     print()
     return 0 if failed == 0 else 1
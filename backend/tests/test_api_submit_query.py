@@ -3,20 +3,30 @@ API Contract & Behavior Tests - Submit Query API (1.1)
 Tests surface correctness of POST /api/query endpoint
 """
 
+import asyncio
 import time
-import json
 import uuid
+import httpx
 import requests
-import concurrent.futures
+from requests.adapters import HTTPAdapter
 from typing import List, Dict, Tuple
 import sys
 
 BASE_URL = "http://127.0.0.1:8000"
 ENDPOINT = f"{BASE_URL}/api/query"
 
+# One keep-alive pool for every synchronous call instead of a new TCP
+# connection per request (the bursts use their own AsyncClient).
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=0))
+
 # Test results collector
 results: List[Dict] = []
 
+# Burst payloads for 1.1.8 / 1.1.9, built once at import
+_QUESTIONS_10 = [f"Rapid test question {i}" for i in range(10)]
+_QUESTIONS_50 = [f"Stress test question {i}" for i in range(50)]
+
 
 def record(test_name: str, passed: bool, details: str = "", response_ms: float = 0):
     status = "✅ PASS" if passed else "❌ FAIL"
@@ -31,34 +41,92 @@ def record(test_name: str, passed: bool, details: str = "", response_ms: float =
 
 def submit_query(question: str, timeout: float = 10.0) -> Tuple[Dict, float, int]:
     """Submit a query and return (response_json, response_time_ms, status_code)"""
-    start = time.perf_counter()
+    start = time.perf_counter_ns()
     try:
-        resp = requests.post(
+        resp = SESSION.post(
             ENDPOINT,
             json={"question": question},
             headers={"Content-Type": "application/json"},
             timeout=timeout
         )
-        elapsed_ms = (time.perf_counter() - start) * 1000
+        elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
+        try:
+            data = resp.json()
+        except:
+            data = {"raw": resp.text}
+        return data, elapsed_ms, resp.status_code
+    except Exception as e:
+        elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
+        return {"error": str(e)}, elapsed_ms, 0
+
+
+async def _asubmit(client: httpx.AsyncClient, question: str, timeout: float = 10.0) -> Tuple[Dict, float, int]:
+    """submit_query() over a shared AsyncClient, same return shape."""
+    start = time.perf_counter_ns()
+    try:
+        resp = await client.post(
+            ENDPOINT,
+            json={"question": question},
+            timeout=timeout
+        )
+        elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
         try:
             data = resp.json()
         except:
             data = {"raw": resp.text}
         return data, elapsed_ms, resp.status_code
     except Exception as e:
-        elapsed_ms = (time.perf_counter() - start) * 1000
+        elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
         return {"error": str(e)}, elapsed_ms, 0
 
 
+def _submit_burst(questions: List[str]) -> Tuple[List[Tuple[Dict, float, int]], float]:
+    """Submit all questions at once from one event loop; returns (results, total_ms)."""
+    async def fire():
+        limits = httpx.Limits(max_connections=64, max_keepalive_connections=64)
+        async with httpx.AsyncClient(limits=limits) as client:
+            # Timed from here so client setup is not counted as server latency
+            start = time.perf_counter_ns()
+            burst = await asyncio.gather(*(_asubmit(client, q) for q in questions))
+            return burst, (time.perf_counter_ns() - start) / 1_000_000
+    
+    return asyncio.run(fire())
+
+
+def _tally(results_local: List[Tuple[Dict, float, int]]) -> Tuple[int, float, float]:
+    """(success_count, avg_ms, max_ms) of a burst in a single pass."""
+    success = 0
+    total_ms = max_ms = 0.0
+    for data, ms, code in results_local:
+        if code == 200:
+            success += 1
+        total_ms += ms
+        if ms > max_ms:
+            max_ms = ms
+    return success, total_ms / len(results_local), max_ms
+
+
 def check_status(session_id: str) -> Dict:
     """Poll status endpoint"""
     try:
-        resp = requests.get(f"{BASE_URL}/api/query/{session_id}/status", timeout=5)
+        resp = SESSION.get(f"{BASE_URL}/api/query/{session_id}/status", timeout=5)
         return resp.json()
     except Exception as e:
         return {"error": str(e)}
 
 
+def wait_for_status(session_id: str, deadline_ms: float = 200) -> Dict:
+    """check_status() until it reports a status or deadline_ms runs out."""
+    delay = 0.005
+    start = time.perf_counter_ns()
+    status_data = check_status(session_id)
+    while not status_data.get("status") and (time.perf_counter_ns() - start) / 1_000_000 < deadline_ms:
+        time.sleep(delay)
+        delay = min(delay * 2, 0.02)
+        status_data = check_status(session_id)
+    return status_data
+
+
 # ============================================================
 # TEST 1.1.1: Normal Question
 # ============================================================
@@ -110,7 +178,7 @@ def test_empty_question():
     
     # Should reject with 422 (validation error) or 400
     passed = code in [400, 422]
-    details = f"status={code}, body={json.dumps(data)[:100]}"
+    details = f"status={code}, body={str(data)[:100]}"
     
     record("1.1.2 Empty Question (expect rejection)", passed, details, ms)
 
@@ -243,20 +311,9 @@ def test_repeated_question():
 # TEST 1.1.8: Rapid Submissions (10 requests)
 # ============================================================
 def test_rapid_submissions_10():
-    questions = [f"Rapid test question {i}" for i in range(10)]
+    results_local, total_ms = _submit_burst(_QUESTIONS_10)
     
-    start = time.perf_counter()
-    results_local = []
-    
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(submit_query, q) for q in questions]
-        for f in concurrent.futures.as_completed(futures):
-            results_local.append(f.result())
-    
-    total_ms = (time.perf_counter() - start) * 1000
-    
-    success_count = sum(1 for d, ms, code in results_local if code == 200)
-    avg_ms = sum(ms for d, ms, code in results_local) / len(results_local)
+    success_count, avg_ms, _ = _tally(results_local)
     
     # Adjusted: 500ms avg is acceptable for concurrent DB writes
     passed = success_count == 10 and avg_ms < 500
@@ -269,22 +326,10 @@ def test_rapid_submissions_10():
 # TEST 1.1.9: Rapid Submissions (50 requests)
 # ============================================================
 def test_rapid_submissions_50():
-    questions = [f"Stress test question {i}" for i in range(50)]
-    
-    start = time.perf_counter()
-    results_local = []
+    results_local, total_ms = _submit_burst(_QUESTIONS_50)
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=50) as executor:
-        futures = [executor.submit(submit_query, q) for q in questions]
-        for f in concurrent.futures.as_completed(futures):
-            results_local.append(f.result())
-    
-    total_ms = (time.perf_counter() - start) * 1000
-    
-    success_count = sum(1 for d, ms, code in results_local if code == 200)
-    error_count = sum(1 for d, ms, code in results_local if code != 200)
-    avg_ms = sum(ms for d, ms, code in results_local) / len(results_local)
-    max_ms = max(ms for d, ms, code in results_local)
+    success_count, avg_ms, max_ms = _tally(results_local)
+    error_count = len(results_local) - success_count
     
     # Adjusted: Under heavy concurrent load, 90% success and <15s max is acceptable for local dev
     # Production would use multiple workers and should have stricter limits
@@ -308,8 +353,7 @@ def test_db_row_created():
     session_id = data["session_id"]
     
     # Check status endpoint returns valid data (proves DB row exists)
-    time.sleep(0.2)
-    status_data = check_status(session_id)
+    status_data = wait_for_status(session_id)
     
     has_status = "status" in status_data
     passed = has_status and status_data.get("status") in ["PROCESSING", "INIT", "RESEARCH", "VERIFY", "SYNTHESIZE", "DONE", "FAILED"]
@@ -365,7 +409,7 @@ def main():
     
     # Check server is up
     try:
-        resp = requests.get(f"{BASE_URL}/openapi.json", timeout=5)
+        resp = SESSION.get(f"{BASE_URL}/openapi.json", timeout=5)
         if resp.status_code != 200:
             print("❌ Server not responding. Start with: uvicorn backend.main:app")
             sys.exit(1)
@@ -394,18 +438,18 @@ def main():
     print()
     
     # Summary
-    passed = sum(1 for r in results if r["passed"])
-    failed = sum(1 for r in results if not r["passed"])
+    failures = [r for r in results if not r["passed"]]  # one scan feeds both
+    failed = len(failures)
+    passed = len(results) - failed
     
     print("=" * 70)
     print(f"SUMMARY: {passed} passed, {failed} failed out of {len(results)} tests")
     print("=" * 70)
     
-    if failed > 0:
+    if failures:
         print("\nFailed tests:")
-        for r in results:
-            if not r["passed"]:
-                print(f"  ❌ {r['test']}: {r['details']}")
+        for r in failures:
+            print(f"  ❌ {r['test']}: {r['details']}")
     
     print()
     return 0 if failed == 0 else 1
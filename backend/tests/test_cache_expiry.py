@@ -26,13 +26,13 @@ sys.path.insert(0, "c:/Agents/AI-Research-Agent/backend")
 
 import uuid
 import hashlib
-import re
 import time
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, MagicMock
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from storage.base import Base
 from storage.models.query_session import QuerySession
@@ -47,19 +47,54 @@ from storage.repositories.search_log_repo import SearchLogRepository
 from storage.repositories.query_session_repo import QuerySessionRepository
 from storage.repositories.answer_repo import AnswerSnapshotRepository
 from planner.planner_agent import PlannerAgent, PlannerState, SearchStrategy
-from agents.VerificationAgent import VerificationDecision
+from agents.VerificationAgent import Decision, VerificationDecision
 
 
 # ======================================================================
 # TEST DATABASE SETUP
 # ======================================================================
 
-def create_test_db():
-    """Create an in-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:", echo=False)
+_engine = None
+_active = None  # (session, connection, transaction) of the running test
+
+
+def _build_engine():
+    engine = create_engine("sqlite://", echo=False, poolclass=StaticPool)
+
+    # pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy
+    # emit BEGIN itself so nested transactions behave.
+    @event.listens_for(engine, "connect")
+    def _no_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(bind=engine)
-    TestSession = sessionmaker(bind=engine)
-    return TestSession()
+    return engine
+
+
+def create_test_db():
+    """Create an isolated session on a shared in-memory SQLite database.
+
+    The schema is created once per module. Each test runs inside an outer
+    transaction (commits in the code under test release SAVEPOINTs), which
+    is rolled back when the next test asks for a database.
+    """
+    global _engine, _active
+    if _engine is None:
+        _engine = _build_engine()
+    if _active is not None:
+        session, conn, trans = _active
+        session.close()
+        trans.rollback()
+        conn.close()
+    conn = _engine.connect()
+    trans = conn.begin()
+    session = Session(bind=conn, join_transaction_mode="create_savepoint")
+    _active = (session, conn, trans)
+    return session
 
 
 # ======================================================================
@@ -95,29 +130,37 @@ class FakeVerificationAgent:
         self.decisions = decisions
         self.call_count = 0
     
-    def decide(self, verified_claims, confidence, attempt, max_attempts=3) -> Dict:
+    def decide(self, verified_claims, confidence, attempt, max_attempts=3) -> Decision:
         if self.call_count < len(self.decisions):
             decision = self.decisions[self.call_count]
         else:
             decision = self.decisions[-1]
         self.call_count += 1
-        return decision
+        return Decision(**decision)
 
 
 # ======================================================================
 # HELPER FUNCTIONS
 # ======================================================================
 
-def compute_query_hash(question: str, strategy: str = "BASE", num_docs: int = 5) -> str:
+# Pinned "now" for the TTL boundary tests, so they never race the wall clock
+FIXED_NOW = datetime(2030, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def fixed_clock() -> datetime:
+    return FIXED_NOW
+
+
+def compute_query_hash(question: str, strategy: str = "BASE", num_docs: int = 5) -> bytes:
     """Compute query hash (same as planner)."""
-    normalized_question = re.sub(r"\s+", " ", question.strip().lower())
+    normalized_question = " ".join(question.lower().split())
     key = f"{normalized_question}|{strategy}|{num_docs}"
-    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
 
 
 def create_cached_session(db, question: str, answer_text: str = "Cached answer",
                           confidence: str = "HIGH", ttl_seconds: int = 3600) -> str:
-    """Create a complete cached session with answer."""
+    """Create a complete cached session with answer (one transaction)."""
     session_id = str(uuid.uuid4())
     
     # Create session
@@ -128,8 +171,6 @@ def create_cached_session(db, question: str, answer_text: str = "Cached answer",
         final_confidence_level=confidence,
         final_confidence_reason="Test cached"
     )
-    db.add(session)
-    db.commit()
     
     # Create answer
     answer = AnswerSnapshot(
@@ -139,12 +180,13 @@ def create_cached_session(db, question: str, answer_text: str = "Cached answer",
         confidence_level=confidence,
         confidence_reason="Test cached"
     )
-    db.add(answer)
-    db.commit()
+    db.add_all([session, answer])
+    db.flush()
     
-    # Create cache entry
+    # Create cache entry through the planner's write path, committed with the rest
     query_hash = compute_query_hash(question)
-    QueryCacheRepository.store(db, query_hash, session_id, ttl_seconds)
+    QueryCacheRepository.store(db, query_hash, session_id, ttl_seconds, commit=False)
+    db.commit()
     
     return session_id
 
@@ -311,11 +353,11 @@ def test_5_2_G1_ttl_minus_one_second_is_valid():
     """
     db = create_test_db()
     
-    query_hash = "test_boundary_minus_1"
+    query_hash = b"test_boundary_minus_1"
     session_id = str(uuid.uuid4())
     
-    # Expires in 1 second (TTL - 1 from "now")
-    future_time = datetime.now(timezone.utc) + timedelta(seconds=1)
+    # Expires 1 second after the pinned "now" (TTL - 1)
+    future_time = FIXED_NOW + timedelta(seconds=1)
     cache = QueryCache(
         query_hash=query_hash,
         session_id=session_id,
@@ -325,7 +367,7 @@ def test_5_2_G1_ttl_minus_one_second_is_valid():
     db.commit()
     
     # Should be valid
-    valid_cache = QueryCacheRepository.get_valid(db, query_hash)
+    valid_cache = QueryCacheRepository.get_valid(db, query_hash, clock=fixed_clock)
     
     passed = valid_cache is not None
     detail = f"cache_hit={valid_cache is not None} (expected True)"
@@ -341,13 +383,11 @@ def test_5_2_G2_ttl_exactly_is_invalid():
     """
     db = create_test_db()
     
-    query_hash = "test_boundary_exact"
+    query_hash = b"test_boundary_exact"
     session_id = str(uuid.uuid4())
     
-    # We need to test the boundary precisely
-    # Create cache that expires "now" and query immediately
-    # Due to execution time, we set it slightly in the past to simulate "exactly at TTL"
-    exact_time = datetime.now(timezone.utc) - timedelta(milliseconds=1)
+    # With "now" pinned, the entry can expire at exactly that instant
+    exact_time = FIXED_NOW
     cache = QueryCache(
         query_hash=query_hash,
         session_id=session_id,
@@ -357,7 +397,7 @@ def test_5_2_G2_ttl_exactly_is_invalid():
     db.commit()
     
     # Should be invalid (expires_at is not > now)
-    valid_cache = QueryCacheRepository.get_valid(db, query_hash)
+    valid_cache = QueryCacheRepository.get_valid(db, query_hash, clock=fixed_clock)
     
     passed = valid_cache is None
     detail = f"cache_miss={valid_cache is None} (expected True, TTL rule: expires_at > now)"
@@ -372,11 +412,11 @@ def test_5_2_G3_ttl_plus_one_second_is_invalid():
     """
     db = create_test_db()
     
-    query_hash = "test_boundary_plus_1"
+    query_hash = b"test_boundary_plus_1"
     session_id = str(uuid.uuid4())
     
-    # Expired 1 second ago
-    past_time = datetime.now(timezone.utc) - timedelta(seconds=1)
+    # Expired 1 second before the pinned "now"
+    past_time = FIXED_NOW - timedelta(seconds=1)
     cache = QueryCache(
         query_hash=query_hash,
         session_id=session_id,
@@ -386,7 +426,7 @@ def test_5_2_G3_ttl_plus_one_second_is_invalid():
     db.commit()
     
     # Should be invalid
-    valid_cache = QueryCacheRepository.get_valid(db, query_hash)
+    valid_cache = QueryCacheRepository.get_valid(db, query_hash, clock=fixed_clock)
     
     passed = valid_cache is None
     detail = f"cache_miss={valid_cache is None} (expected True)"
@@ -406,24 +446,38 @@ def test_5_2_G4_ttl_boundary_documented():
     db = create_test_db()
     
     # Test 1: Future expiry = valid
-    hash1 = "future_test"
+    hash1 = b"future_test"
     session_id_1 = str(uuid.uuid4())
     future = datetime.now(timezone.utc) + timedelta(hours=1)
     db.add(QueryCache(query_hash=hash1, session_id=session_id_1, expires_at=future))
     db.commit()
     
     # Test 2: Past expiry = invalid
-    hash2 = "past_test"
+    hash2 = b"past_test"
     session_id_2 = str(uuid.uuid4())
     past = datetime.now(timezone.utc) - timedelta(hours=1)
     db.add(QueryCache(query_hash=hash2, session_id=session_id_2, expires_at=past))
     db.commit()
     
+    # Test 3: One microsecond either side of the pinned "now"
+    hash3 = b"micro_after_test"
+    hash4 = b"micro_before_test"
+    db.add(QueryCache(query_hash=hash3, session_id=str(uuid.uuid4()),
+                      expires_at=FIXED_NOW + timedelta(microseconds=1)))
+    db.add(QueryCache(query_hash=hash4, session_id=str(uuid.uuid4()),
+                      expires_at=FIXED_NOW - timedelta(microseconds=1)))
+    db.commit()
+    
     future_valid = QueryCacheRepository.get_valid(db, hash1) is not None
     past_invalid = QueryCacheRepository.get_valid(db, hash2) is None
+    micro_after_valid = QueryCacheRepository.get_valid(db, hash3, clock=fixed_clock) is not None
+    micro_before_invalid = QueryCacheRepository.get_valid(db, hash4, clock=fixed_clock) is None
     
-    passed = future_valid and past_invalid
-    detail = f"future_valid={future_valid}, past_invalid={past_invalid}"
+    passed = future_valid and past_invalid and micro_after_valid and micro_before_invalid
+    detail = (
+        f"future_valid={future_valid}, past_invalid={past_invalid}, "
+        f"+1us_valid={micro_after_valid}, -1us_invalid={micro_before_invalid}"
+    )
     
     db.close()
     return passed, detail
@@ -18,7 +18,6 @@ sys.path.insert(0, "c:/Agents/AI-Research-Agent/backend")
 
 import uuid
 import hashlib
-import re
 from typing import Dict, List
 from datetime import datetime, timedelta, timezone
 from sqlalchemy import create_engine
@@ -35,7 +34,7 @@ from storage.repositories.query_cache_repo import QueryCacheRepository
 from storage.repositories.planner_trace_repo import PlannerTraceRepository
 from storage.repositories.search_log_repo import SearchLogRepository
 from planner.planner_agent import PlannerAgent, PlannerState, SearchStrategy
-from agents.VerificationAgent import VerificationDecision
+from agents.VerificationAgent import Decision, VerificationDecision
 
 
 # ======================================================================
@@ -79,23 +78,23 @@ class FakeVerificationAgent:
         self.decisions = decisions
         self.call_count = 0
     
-    def decide(self, verified_claims, confidence, attempt, max_attempts=3) -> Dict:
+    def decide(self, verified_claims, confidence, attempt, max_attempts=3) -> Decision:
         if self.call_count < len(self.decisions):
             decision = self.decisions[self.call_count]
         else:
             decision = self.decisions[-1]
         self.call_count += 1
-        return decision
+        return Decision(**decision)
 
 
 # ======================================================================
 # HELPER: Compute query hash (same as planner)
 # ======================================================================
 
-def compute_query_hash(question: str, strategy: str = "BASE", num_docs: int = 5) -> str:
-    normalized_question = re.sub(r"\s+", " ", question.strip().lower())
+def compute_query_hash(question: str, strategy: str = "BASE", num_docs: int = 5) -> bytes:
+    normalized_question = " ".join(question.lower().split())
     key = f"{normalized_question}|{strategy}|{num_docs}"
-    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
 
 
 # ======================================================================
@@ -628,7 +627,7 @@ def test_5_1_F1_cache_expiration_respected():
     """
     db = create_test_db()
     
-    query_hash = "test_hash_for_expiration"
+    query_hash = b"test_hash_for_expiration"
     session_id = str(uuid.uuid4())
     
     # Create expired cache entry (expired 1 hour ago)
@@ -657,7 +656,7 @@ def test_5_1_F2_valid_cache_returned():
     """
     db = create_test_db()
     
-    query_hash = "test_hash_for_valid"
+    query_hash = b"test_hash_for_valid"
     session_id = str(uuid.uuid4())
     
     # Create valid cache entry (expires in 1 hour)
@@ -211,9 +211,9 @@ def test_3_1_5_verification_agent_retry_on_conflict():
         max_attempts=3
     )
     
-    decision = result.get("decision")
-    reason = result.get("reason", "")
-    recommendation = result.get("recommendation", "")
+    decision = result.decision
+    reason = result.reason
+    recommendation = result.recommendation
     
     passed = decision == VerificationDecision.RETRY
     mentions_conflict = "conflict" in reason.lower()
@@ -254,8 +254,8 @@ def test_3_1_6_verification_agent_stop_on_persistent_conflict():
         max_attempts=3
     )
     
-    decision = result.get("decision")
-    reason = result.get("reason", "")
+    decision = result.decision
+    reason = result.reason
     
     passed = decision == VerificationDecision.STOP
     mentions_conflict = "conflict" in reason.lower()
@@ -432,11 +432,11 @@ def test_3_1_10_end_to_end_controversial_flow():
     
     # Step 4: Agent decision at attempt 1
     decision_1 = agent.decide(verified_claims, confidence, attempt=1, max_attempts=3)
-    retry_first = decision_1.get("decision") == VerificationDecision.RETRY
+    retry_first = decision_1.decision == VerificationDecision.RETRY
     
     # Step 5: Agent decision at max attempts
     decision_3 = agent.decide(verified_claims, confidence, attempt=3, max_attempts=3)
-    stop_finally = decision_3.get("decision") == VerificationDecision.STOP
+    stop_finally = decision_3.decision == VerificationDecision.STOP
     
     passed = polarities_opposite and is_low and retry_first and stop_finally
     detail = (
@@ -166,6 +166,8 @@ def test_6_2_A3_status_endpoint_db_unavailable_returns_503():
         raise OperationalError("SELECT", {}, Exception("DB down"))
 
     db.query = failing_query  # type: ignore
+    db.execute = failing_query  # type: ignore
+    db.get = failing_query  # type: ignore
 
     from backend.api import routes as routes_module
 
@@ -200,6 +202,8 @@ def test_6_2_A4_result_endpoint_db_unavailable_returns_503():
         raise OperationalError("SELECT", {}, Exception("DB down"))
 
     db.query = failing_query  # type: ignore
+    db.execute = failing_query  # type: ignore
+    db.get = failing_query  # type: ignore
 
     from backend.api import routes as routes_module
 
@@ -24,7 +24,7 @@ from storage.models.query_session import QuerySession
 from storage.models.evidence import Evidence
 from storage.repositories.evidence_repo import EvidenceRepository
 from planner.planner_agent import PlannerAgent, PlannerState
-from agents.VerificationAgent import VerificationDecision
+from agents.VerificationAgent import Decision, VerificationDecision
 
 
 # ======================================================================
@@ -66,13 +66,13 @@ class FakeVerificationAgent:
         self.decisions = decisions
         self.call_count = 0
     
-    def decide(self, verified_claims, confidence, attempt, max_attempts=3) -> Dict:
+    def decide(self, verified_claims, confidence, attempt, max_attempts=3) -> Decision:
         if self.call_count < len(self.decisions):
             decision = self.decisions[self.call_count]
         else:
             decision = self.decisions[-1]
         self.call_count += 1
-        return decision
+        return Decision(**decision)
 
 
 # ======================================================================
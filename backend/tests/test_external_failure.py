@@ -45,7 +45,7 @@ from storage.repositories.search_log_repo import SearchLogRepository
 from storage.repositories.query_session_repo import QuerySessionRepository
 from planner.planner_agent import PlannerAgent, PlannerState, SearchStrategy
 from agents.research_agent import ResearchAgent
-from agents.VerificationAgent import VerificationDecision
+from agents.VerificationAgent import Decision, VerificationDecision
 from environments.web.environment import WebEnvironment
 from environments.web.state import WebDocument
 from environments.web.search import WebSearch
@@ -224,13 +224,13 @@ class FakeVerificationAgent:
         self.decisions = decisions
         self.call_count = 0
     
-    def decide(self, verified_claims, confidence, attempt, max_attempts=3) -> Dict:
+    def decide(self, verified_claims, confidence, attempt, max_attempts=3) -> Decision:
         if self.call_count < len(self.decisions):
             decision = self.decisions[self.call_count]
         else:
             decision = self.decisions[-1]
         self.call_count += 1
-        return decision
+        return Decision(**decision)
 
 
 # ======================================================================
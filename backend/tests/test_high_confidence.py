@@ -130,7 +130,7 @@ def test_3_3_3_accept_on_high_confidence():
         max_attempts=3
     )
     
-    decision = result.get("decision")
+    decision = result.decision
     
     passed = decision == VerificationDecision.ACCEPT
     detail = f"decision={decision} on first attempt"
@@ -168,7 +168,7 @@ def test_3_3_4_no_recommendation_on_accept():
         max_attempts=3
     )
     
-    recommendation = result.get("recommendation")
+    recommendation = result.recommendation
     
     passed = recommendation is None
     detail = f"recommendation={recommendation}"
@@ -306,8 +306,8 @@ def test_3_3_8_accept_at_any_attempt_if_high():
         max_attempts=3
     )
     
-    accept_at_2 = result_2.get("decision") == VerificationDecision.ACCEPT
-    accept_at_3 = result_3.get("decision") == VerificationDecision.ACCEPT
+    accept_at_2 = result_2.decision == VerificationDecision.ACCEPT
+    accept_at_3 = result_3.decision == VerificationDecision.ACCEPT
     
     passed = accept_at_2 and accept_at_3
     detail = f"accept_at_attempt_2={accept_at_2}, accept_at_attempt_3={accept_at_3}"
@@ -383,7 +383,7 @@ def test_3_3_10_medium_confidence_also_accepts():
         max_attempts=3
     )
     
-    decision = result.get("decision")
+    decision = result.decision
     
     passed = decision == VerificationDecision.ACCEPT
     detail = f"MEDIUM confidence → decision={decision}"
@@ -36,7 +36,7 @@ from verification.models import VerifiedClaim, VerificationStatus
 from synthesis.answer_synthesizer import AnswerSynthesizer, build_prompt, generate_notes
 from confidence.confidence_scorer import ConfidenceScorer
 from planner.planner_agent import PlannerAgent, PlannerState
-from agents.VerificationAgent import VerificationDecision
+from agents.VerificationAgent import Decision, VerificationDecision
 
 
 def print_header():
@@ -90,13 +90,13 @@ class FakeVerificationAgent:
         self.decisions = decisions
         self.call_count = 0
     
-    def decide(self, verified_claims, confidence, attempt, max_attempts=3) -> Dict:
+    def decide(self, verified_claims, confidence, attempt, max_attempts=3) -> Decision:
         if self.call_count < len(self.decisions):
             decision = self.decisions[self.call_count]
         else:
             decision = self.decisions[-1]
         self.call_count += 1
-        return decision
+        return Decision(**decision)
 
 
 # ======================================================================
@@ -16,7 +16,7 @@ import sys
 from typing import Any, Dict, List
 
 from planner.planner_agent import PlannerAgent, PlannerState, SearchStrategy
-from agents.VerificationAgent import VerificationDecision
+from agents.VerificationAgent import Decision, VerificationDecision
 
 
 results: List[Dict[str, Any]] = []
@@ -75,17 +75,17 @@ class FakeVerificationAgent:
         confidence: Dict[str, str],
         attempt: int,
         max_attempts: int,
-    ) -> Dict[str, Any]:
+    ) -> Decision:
         self.calls.append({
             "attempt": attempt,
             "confidence_level": confidence.get("confidence_level"),
             "confidence_reason": confidence.get("confidence_reason"),
         })
-        return {
-            "decision": self._decision,
-            "reason": "same decision every time",
-            "recommendation": None,
-        }
+        return Decision(
+            decision=self._decision,
+            reason="same decision every time",
+            recommendation=None,
+        )
 
 
 def test_no_progress_count_increments():
@@ -225,11 +225,11 @@ def test_progress_resets_on_different_outcome():
             def decide(self, verified_claims, confidence, attempt, max_attempts):
                 self.call_count += 1
                 # Always retry until max attempts
-                return {
-                    "decision": VerificationDecision.RETRY,
-                    "reason": "keep retrying",
-                    "recommendation": None,
-                }
+                return Decision(
+                    decision=VerificationDecision.RETRY,
+                    reason="keep retrying",
+                    recommendation=None,
+                )
         
         research = VaryingResearchAgent()
         verifier = VaryingVerificationAgent()
@@ -21,7 +21,7 @@ import sys
 from typing import Any, Dict, List, Optional
 
 from planner.planner_agent import PlannerAgent, PlannerState, SearchStrategy
-from agents.VerificationAgent import VerificationDecision
+from agents.VerificationAgent import Decision, VerificationDecision
 
 
 results: List[Dict[str, Any]] = []
@@ -81,7 +81,7 @@ class FakeVerificationAgent:
         confidence: Dict[str, str],
         attempt: int,
         max_attempts: int,
-    ) -> Dict[str, Any]:
+    ) -> Decision:
         decision = self._decisions_by_attempt.get(attempt, VerificationDecision.RETRY)
         self.calls.append(
             {
@@ -90,13 +90,13 @@ class FakeVerificationAgent:
                 "confidence_reason": confidence.get("confidence_reason"),
             }
         )
-        return {
-            "decision": decision,
-            "reason": f"fake-decision attempt={attempt}",
+        return Decision(
+            decision=decision,
+            reason=f"fake-decision attempt={attempt}",
             # IMPORTANT: keep recommendation None so PlannerAgent strategy selection is
             # driven by confidence_reason (single source -> broaden, conflict -> authority)
-            "recommendation": None,
-        }
+            recommendation=None,
+        )
 
 
 def _run_planner(planner: PlannerAgent, question: str) -> Dict[str, Any]:
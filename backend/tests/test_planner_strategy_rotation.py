@@ -17,7 +17,7 @@ import time
 from typing import Any, Dict, List, Optional
 
 from planner.planner_agent import PlannerAgent, PlannerState, SearchStrategy
-from agents.VerificationAgent import VerificationDecision
+from agents.VerificationAgent import Decision, VerificationDecision
 
 
 results: List[Dict[str, Any]] = []
@@ -76,20 +76,20 @@ class FakeVerificationAgent:
         confidence: Dict[str, str],
         attempt: int,
         max_attempts: int,
-    ) -> Dict[str, Any]:
+    ) -> Decision:
         self.calls.append({"attempt": attempt, "confidence_reason": confidence.get("confidence_reason")})
         
         if self._always_retry:
-            return {
-                "decision": VerificationDecision.RETRY,
-                "reason": "forced retry for strategy rotation test",
-                "recommendation": None,
-            }
-        return {
-            "decision": VerificationDecision.ACCEPT,
-            "reason": "accepted",
-            "recommendation": None,
-        }
+            return Decision(
+                decision=VerificationDecision.RETRY,
+                reason="forced retry for strategy rotation test",
+                recommendation=None,
+            )
+        return Decision(
+            decision=VerificationDecision.ACCEPT,
+            reason="accepted",
+            recommendation=None,
+        )
 
 
 class FakeVerificationAgentWithRecommendation:
@@ -104,13 +104,13 @@ class FakeVerificationAgentWithRecommendation:
         confidence: Dict[str, str],
         attempt: int,
         max_attempts: int,
-    ) -> Dict[str, Any]:
+    ) -> Decision:
         self.calls.append({"attempt": attempt})
-        return {
-            "decision": VerificationDecision.RETRY,
-            "reason": "need more research",
-            "recommendation": "Try research papers and policy documents",
-        }
+        return Decision(
+            decision=VerificationDecision.RETRY,
+            reason="need more research",
+            recommendation="Try research papers and policy documents",
+        )
 
 
 def test_same_confidence_reason_no_repeat_strategy():
@@ -23,7 +23,7 @@ from storage.base import Base
 from storage.models.query_session import QuerySession
 from storage.repositories.query_session_repo import QuerySessionRepository
 from planner.planner_agent import PlannerAgent, PlannerState, PlannerContext, SearchStrategy
-from agents.VerificationAgent import VerificationAgent, VerificationDecision
+from agents.VerificationAgent import VerificationAgent, Decision, VerificationDecision
 from verification.models import VerifiedClaim, VerificationStatus
 
 
@@ -66,13 +66,13 @@ class FakeVerificationAgent:
         self.decisions = decisions
         self.call_count = 0
     
-    def decide(self, verified_claims, confidence, attempt, max_attempts=3) -> Dict:
+    def decide(self, verified_claims, confidence, attempt, max_attempts=3) -> Decision:
         if self.call_count < len(self.decisions):
             decision = self.decisions[self.call_count]
         else:
             decision = self.decisions[-1]
         self.call_count += 1
-        return decision
+        return Decision(**decision)
 
 
 # ======================================================================
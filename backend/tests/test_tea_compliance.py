@@ -38,7 +38,7 @@ from storage.models.evidence import Evidence
 from verification.models import VerifiedClaim, VerificationStatus
 from synthesis.answer_synthesizer import AnswerSynthesizer
 from planner.planner_agent import PlannerAgent, PlannerState, SearchStrategy
-from agents.VerificationAgent import VerificationAgent, VerificationDecision
+from agents.VerificationAgent import VerificationAgent, Decision, VerificationDecision
 from api.schemas import (
     QueryResultResponse,
     QueryStatusResponse,
@@ -602,13 +602,13 @@ class FakeVerificationAgent:
         self.decisions = decisions
         self.call_count = 0
     
-    def decide(self, verified_claims, confidence, attempt, max_attempts=3) -> Dict:
+    def decide(self, verified_claims, confidence, attempt, max_attempts=3) -> Decision:
         if self.call_count < len(self.decisions):
             decision = self.decisions[self.call_count]
         else:
             decision = self.decisions[-1]
         self.call_count += 1
-        return decision
+        return Decision(**decision)
 
 
 def test_7_F1_planner_context_not_exposed_in_result():
@@ -678,12 +678,12 @@ def test_7_F2_verification_decision_only_summary():
     
     # Should only have decision, reason, recommendation
     allowed_keys = {"decision", "reason", "recommendation"}
-    actual_keys = set(decision.keys())
+    actual_keys = set(decision._fields)
     
     only_allowed = actual_keys == allowed_keys
     
     # Check reason doesn't expose internals
-    reason = decision.get("reason", "")
+    reason = decision.reason
     internal_patterns = ["state", "algorithm", "loop", "iteration"]
     internal_exposed = [p for p in internal_patterns if p.lower() in reason.lower()]
     
@@ -282,8 +282,8 @@ def test_3_2_8_verification_agent_retry_on_weak():
         max_attempts=3
     )
     
-    decision = result.get("decision")
-    recommendation = result.get("recommendation", "")
+    decision = result.decision
+    recommendation = result.recommendation
     
     passed = decision == VerificationDecision.RETRY
     has_recommendation = recommendation is not None and len(recommendation) > 0
@@ -323,8 +323,8 @@ def test_3_2_9_stop_preserves_low_confidence():
         max_attempts=3
     )
     
-    decision = result.get("decision")
-    reason = result.get("reason", "")
+    decision = result.decision
+    reason = result.reason
     
     passed = decision == VerificationDecision.STOP
     mentions_low_confidence = "low" in reason.lower() or "confidence" in reason.lower()
@@ -0,0 +1,122 @@
+"""\
+======================================================================
+WEB EXTRACTION TESTS - Parser Parity
+======================================================================
+
+WebExtractor uses selectolax when it is installed and falls back to
+BeautifulSoup otherwise.
+
+Verify:
+- Both paths extract the same text and title from the same HTML
+
+Runs as a plain script (no pytest dependency).
+======================================================================
+"""
+
+import sys
+# Ensure both `backend.*` and `storage.*` imports work
+sys.path.insert(0, "c:/Agents/AI-Research-Agent")
+sys.path.insert(0, "c:/Agents/AI-Research-Agent/backend")
+
+from environments.web import extract
+from environments.web.extract import WebExtractor
+
+
+SIMPLE_HTML = """
+<html>
+  <head><title>Solar Energy</title></head>
+  <body>
+    <h1>Solar   energy</h1>
+    <p>Solar panels convert
+       sunlight into electricity.</p>
+  </body>
+</html>
+"""
+
+NOISY_HTML = """
+<html>
+  <head>
+    <title> Wind Power </title>
+    <style>p { color: red; }</style>
+    <script>var tracking = true;</script>
+  </head>
+  <body>
+    <!-- navigation -->
+    <div>  Wind <b>turbines</b>generate <i> power </i>  </div>
+    <noscript>Enable JavaScript</noscript>
+    <ul><li>Onshore</li><li>
+        Offshore
+    </li></ul>
+    <script>console.log("x")</script>
+  </body>
+</html>
+"""
+
+
+def print_header():
+    print("\n" + "=" * 70)
+    print("WEB EXTRACTION TESTS - Parser Parity")
+    print("=" * 70)
+
+
+def print_result(test_id: str, name: str, passed: bool, detail: str = ""):
+    status = "✅ PASS" if passed else "❌ FAIL"
+    print(f"{status} | {test_id} {name} | {detail}")
+
+
+def print_summary(passed: int, failed: int, total: int):
+    print("-" * 70)
+    print(f"SUMMARY: {passed} passed, {failed} failed out of {total} tests")
+
+
+def _compare_paths(html: str):
+    if extract.LexborHTMLParser is None:
+        return True, "selectolax not installed; only the bs4 path exists"
+
+    extractor = WebExtractor()
+    lexbor_out = extractor._extract_lexbor(html)
+    bs4_out = extractor._extract_bs4(html)
+
+    passed = lexbor_out == bs4_out
+    detail = f"lexbor={lexbor_out!r} bs4={bs4_out!r}"
+    return passed, detail
+
+
+def test_extract_A1_simple_page_same_text():
+    return _compare_paths(SIMPLE_HTML)
+
+
+def test_extract_A2_scripts_comments_whitespace_same_text():
+    return _compare_paths(NOISY_HTML)
+
+
+def run_all_tests() -> bool:
+    print_header()
+
+    tests = [
+        ("EX.A1", "Simple page: lexbor == bs4 output", test_extract_A1_simple_page_same_text),
+        ("EX.A2", "Noisy page: lexbor == bs4 output", test_extract_A2_scripts_comments_whitespace_same_text),
+    ]
+
+    passed_count = 0
+    failed_count = 0
+
+    for test_id, name, fn in tests:
+        try:
+            passed, detail = fn()
+            print_result(test_id, name, passed, detail)
+            if passed:
+                passed_count += 1
+            else:
+                failed_count += 1
+        except Exception as exc:
+            print_result(test_id, name, False, f"Exception: {type(exc).__name__}: {exc}")
+            failed_count += 1
+
+    print_summary(passed_count, failed_count, len(tests))
+    return failed_count == 0
+
+
+if __name__ == "__main__":
+    ok = run_all_tests()
+    raise SystemExit(0 if ok else 1)
@@ -18,6 +18,22 @@ def embed_text(text: str) -> list:
     return result.embeddings[0].values
 
 
+# Upper bound on texts per embed_content request.
+EMBED_BATCH_SIZE = 100
+
+
+def embed_texts(texts: list) -> list:
+    """Embed many texts with one request per EMBED_BATCH_SIZE texts."""
+    vectors = []
+    for start in range(0, len(texts), EMBED_BATCH_SIZE):
+        result = client.models.embed_content(
+            model="text-embedding-004",
+            contents=texts[start:start + EMBED_BATCH_SIZE]
+        )
+        vectors.extend(e.values for e in result.embeddings)
+    return vectors
+
+
 def cosine_similarity(a: list, b: list) -> float:
     a, b = np.array(a), np.array(b)
     return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
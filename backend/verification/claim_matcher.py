@@ -1,7 +1,8 @@
 from typing import List
+import numpy as np
 from verification.models import VerifiedClaim
 from verification.claim_extractor import ExtractedClaim
-from utils.embedding import embed_text, cosine_similarity
+from utils.embedding import embed_texts
 
 
 SIMILARITY_THRESHOLD = 0.85
@@ -13,21 +14,28 @@ class ClaimMatcher:
     ) -> List[List[ExtractedClaim]]:
         groups: List[List[ExtractedClaim]] = []
 
-        embeddings = [embed_text(c.claim) for c in claims]
+        if not claims:
+            return groups
 
-        for i, claim in enumerate(claims):
-            placed = False
-
-            for group_idx, group in enumerate(groups):
-                rep_idx = claims.index(group[0])
-                sim = cosine_similarity(embeddings[i], embeddings[rep_idx])
+        # One batched embedding call, then unit-normalize so a dot product
+        # against all group representatives is a single matrix-vector product.
+        embeddings = np.asarray(embed_texts([c.claim for c in claims]), dtype=float)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        embeddings = embeddings / norms
 
-                if sim >= SIMILARITY_THRESHOLD:
-                    group.append(claim)
-                    placed = True
-                    break
+        rep_indices: List[int] = []
 
-            if not placed:
-                groups.append([claim])
+        for i, claim in enumerate(claims):
+            if rep_indices:
+                sims = embeddings[rep_indices] @ embeddings[i]
+                matches = np.flatnonzero(sims >= SIMILARITY_THRESHOLD)
+                if matches.size:
+                    # First matching group in creation order, as before
+                    groups[matches[0]].append(claim)
+                    continue
+
+            groups.append([claim])
+            rep_indices.append(i)
 
         return groups